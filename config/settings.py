@@ -15,6 +15,17 @@ FPS_LIMIT = 60
 INITIAL_TIME = 1 * 60    # 1 minute in seconds for each player
 TIME_WARNING = 50       # Warning when 60 seconds left
 TIME_CRITICAL = 30      # Critical time warning when 30 seconds left
+MOVE_GENERATOR = "piece"  # "piece" for the Piece classes, "bitboard" for the bitboard backend
+
+# Computer opponent settings
+COMPUTER_COLOR = "black"  # Side played by the computer in single-player games
+AI_MAX_DEPTH = 5          # Deepest iteration of the search
+AI_MAX_THINK_TIME = 3     # Never think longer than this many seconds per move
+AI_TIME_DIVISOR = 20      # Spend at most 1/20 of the remaining clock on a move
+AI_TT_SIZE_MB = 32        # Memory cap of the search transposition table
+
+# Position analysis cache (legal moves, game end and the threat overlay)
+ANALYSIS_TABLE_SIZE_MB = 2
 
 # Modern Color Scheme
 WHITE = (248, 249, 250)      # Off-white background
@@ -52,18 +63,29 @@ CAPTURED_PIECE_SIZE = 45      # Slightly larger captured pieces
 FONT_SIZE_LARGE = 40
 FONT_SIZE_MEDIUM = 28
 FONT_SIZE_SMALL = 20
+TEXT_CACHE_SIZE = 256         # Rendered text surfaces kept by the LRU text cache
 
 # Move History Panel Settings
 HISTORY_PANEL_HEIGHT = 180    # Taller history panel
 
 # Piece Settings
 PIECE_SCALE = 0.90           # Scale pieces to 90% of square size
+PIECE_SIZE = int(SQUARE_SIZE * PIECE_SCALE)  # Size of the pieces drawn on the board
 
 # Animation Settings
 ANIMATION_SPEED = 8  # Pixels per frame
 ANIMATION_FPS = 60   # Animation frame rate
 MIN_ANIMATION_SPEED = 2  # Minimum speed at the end of animation
 ANIMATION_SMOOTHING = 0.85  # Smoothing factor for animation (0-1)
+ANIMATION_DURATION = 100 / (ANIMATION_SPEED * ANIMATION_FPS)  # Seconds per move, whatever the frame rate
+PREMOVE_QUEUE_SIZE = 4  # Clicks kept while a move animates or the computer thinks, later ones are ignored
+
+# Frame rate caps per loop state. Idle loops sleep until input arrives, the
+# game clock reaches its next second or a message expires
+GAME_ACTIVE_FPS = ANIMATION_FPS  # While a piece moves or the computer is to move
+GAME_IDLE_FPS = 30               # While waiting for the player
+MENU_FPS = 30
+IDLE_MAX_WAIT = 1000             # Longest idle sleep in milliseconds
 
 # Promotion Settings
 PROMOTION_PANEL_WIDTH = 400
@@ -91,6 +113,7 @@ MENU_BUTTON_BORDER_RADIUS = 10  # Rounded corners for buttons
 
 # Menu button texts
 MENU_BUTTON_NEW_GAME = "New Game"
+MENU_BUTTON_COMPUTER_GAME = "Play Computer"
 MENU_BUTTON_SAVE_GAME = "Save Game"
 MENU_BUTTON_LOAD_GAME = "Load Game"
 MENU_BUTTON_QUIT = "Quit"
@@ -101,5 +124,8 @@ MENU_BUTTON_LOAD = (52, 152, 219)  # Blue for load
 
 # Game saving/loading settings
 SAVE_DIR = "saved_games"
+JOURNAL_SYNC_EVERY = 8             # fsync the move journal after this many records
+JOURNAL_CHECKPOINT_INTERVAL = 50   # Moves between full snapshots in the journal
+SAVE_POLL_INTERVAL = 50           # Longest idle wait in milliseconds while a save or load is running
 SAVE_MESSAGE_DURATION = 2  # seconds
 LOAD_MESSAGE_DURATION = 2  # seconds
\ No newline at end of file
@@ -12,6 +12,7 @@ def main():
     
     # Create menu and game instances
     menu = Menu(screen)
+    clock = pygame.time.Clock()
     game = None
     current_screen = "menu"
     
@@ -19,20 +20,33 @@ def main():
     running = True
     while running:
         if current_screen == "menu":
+            # Draw menu if it changed, then sleep until the next input event
+            menu.draw()
+            clock.tick(MENU_FPS)
+            
             # Handle menu events
-            for event in pygame.event.get():
+            for event in [pygame.event.wait()] + pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
                 else:
                     action = menu.handle_event(event)
                     if action == "new_game":
+                        if game:
+                            game.close()
                         game = Game()
                         current_screen = "game"
                         logger.info("Starting new game")
+                    elif action == "computer_game":
+                        if game:
+                            game.close()
+                        game = Game(computer_color=COMPUTER_COLOR)
+                        current_screen = "game"
+                        logger.info(f"Starting new game against the computer playing {COMPUTER_COLOR}")
                     elif action == "save_game":
                         if game:
+                            # The save runs in the background and reports back in the game
                             if game.save_current_game():
-                                logger.info("Game saved successfully")
+                                logger.info("Saving game")
                             else:
                                 logger.error("Failed to save game")
                         else:
@@ -40,34 +54,33 @@ def main():
                     elif action == "load_game":
                         saved_games = None
                         if game:
-                            saved_games = game.get_saved_games()
+                            saved_games = game.get_saved_games(limit=1)
                         else:
                             game = Game()
-                            saved_games = game.get_saved_games()
+                            saved_games = game.get_saved_games(limit=1)
                         
                         if saved_games:
-                            if game.load_saved_game(saved_games[0]['filename']):
-                                current_screen = "game"
-                                logger.info("Game loaded successfully")
-                            else:
-                                logger.error("Failed to load game")
+                            # The game swaps the save in once the background load finishes
+                            game.request_load(saved_games[0]['filename'])
+                            current_screen = "game"
+                            logger.info("Loading saved game")
                         else:
                             logger.warning("No saved games found")
                     elif action == "quit":
                         running = False
             
-            # Draw menu
-            menu.draw()
-            
         elif current_screen == "game":
             # Run game and handle return value
             result = game.run()
             if result == "menu":
                 current_screen = "menu"
+                menu.request_redraw()
                 logger.info("Returned to main menu")
             elif result == "quit":
                 running = False
     
+    if game:
+        game.close()
     pygame.quit()
 
 if __name__ == "__main__":
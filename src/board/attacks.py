@@ -0,0 +1,69 @@
+"""Attack detection on the 8x8 board list.
+
+Instead of generating every enemy move, attacks on a square are found by
+casting rays and jumps outward from the square itself ("super-piece"
+detection) and looking at the first piece met in each direction.
+"""
+
+STRAIGHT_DIRECTIONS = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+DIAGONAL_DIRECTIONS = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+KNIGHT_OFFSETS = [(-2, -1), (-2, 1), (2, -1), (2, 1), (-1, -2), (1, -2), (-1, 2), (1, 2)]
+KING_OFFSETS = STRAIGHT_DIRECTIONS + DIAGONAL_DIRECTIONS
+
+
+def locate_king(board, color):
+    """Scan the board for the king of the given color and return its (row, col)"""
+    for row in range(8):
+        for col in range(8):
+            piece = board[row][col]
+            if piece and piece.position == "king" and piece.color == color:
+                return (row, col)
+    return None
+
+
+def _piece_at(board, row, col, color, piece_types):
+    """Check if the square holds a piece of color whose type is in piece_types"""
+    if 0 <= row < 8 and 0 <= col < 8:
+        piece = board[row][col]
+        return piece is not None and piece.color == color and piece.position in piece_types
+    return False
+
+
+def _first_piece_on_ray(board, row, col, dir_row, dir_col):
+    """Return the first piece met when walking from a square in one direction"""
+    row, col = row + dir_row, col + dir_col
+    while 0 <= row < 8 and 0 <= col < 8:
+        piece = board[row][col]
+        if piece is not None:
+            return piece
+        row, col = row + dir_row, col + dir_col
+    return None
+
+
+def is_square_attacked(board, row, col, by_color):
+    """Check if any piece of by_color attacks the given square"""
+    # Pawns attack diagonally forward, so look one row back towards their side
+    pawn_row = row + 1 if by_color == "white" else row - 1
+    if (_piece_at(board, pawn_row, col - 1, by_color, ("pawn",)) or
+            _piece_at(board, pawn_row, col + 1, by_color, ("pawn",))):
+        return True
+
+    for dir_row, dir_col in KNIGHT_OFFSETS:
+        if _piece_at(board, row + dir_row, col + dir_col, by_color, ("knight",)):
+            return True
+
+    for dir_row, dir_col in KING_OFFSETS:
+        if _piece_at(board, row + dir_row, col + dir_col, by_color, ("king",)):
+            return True
+
+    for dir_row, dir_col in STRAIGHT_DIRECTIONS:
+        piece = _first_piece_on_ray(board, row, col, dir_row, dir_col)
+        if piece and piece.color == by_color and piece.position in ("rook", "queen"):
+            return True
+
+    for dir_row, dir_col in DIAGONAL_DIRECTIONS:
+        piece = _first_piece_on_ray(board, row, col, dir_row, dir_col)
+        if piece and piece.color == by_color and piece.position in ("bishop", "queen"):
+            return True
+
+    return False
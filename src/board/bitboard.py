@@ -0,0 +1,385 @@
+"""Bitboard move generation backend.
+
+Squares are numbered ``row * 8 + col`` using the same (row, col) layout as the
+8x8 board list, so row 0 is black's back rank. Every (color, piece type) pair
+owns a 64-bit integer with one bit set per occupied square. GameState keeps
+one Bitboards instance and updates it with every move it makes and unmakes.
+Legal moves are filtered with check and pin masks found by looking outward
+from the king, so no candidate move is played to test it.
+"""
+
+COLORS = ["white", "black"]
+PIECE_TYPES = ["pawn", "knight", "bishop", "rook", "queen", "king"]
+
+KNIGHT_OFFSETS = [(-2, -1), (-2, 1), (2, -1), (2, 1), (-1, -2), (1, -2), (-1, 2), (1, 2)]
+KING_OFFSETS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+STRAIGHT_DIRECTIONS = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+DIAGONAL_DIRECTIONS = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+PAWN_DIRECTION = {"white": -1, "black": 1}
+PAWN_START_ROW = {"white": 6, "black": 1}
+
+
+def square_index(row, col):
+    """Convert board coordinates to a square index"""
+    return row * 8 + col
+
+
+SQUARE_COORDS = [divmod(square, 8) for square in range(64)]  # Shared (row, col) tuple of every square
+
+
+def square_coords(square):
+    """Convert a square index back to (row, col)"""
+    return SQUARE_COORDS[square]
+
+
+def iter_bits(bitboard):
+    """Yield the square index of every set bit"""
+    while bitboard:
+        lowest = bitboard & -bitboard
+        yield lowest.bit_length() - 1
+        bitboard ^= lowest
+
+
+def _build_jump_table(offsets):
+    """Precompute attack masks for a piece that jumps by fixed offsets"""
+    table = []
+    for square in range(64):
+        row, col = square_coords(square)
+        mask = 0
+        for dir_row, dir_col in offsets:
+            new_row, new_col = row + dir_row, col + dir_col
+            if 0 <= new_row < 8 and 0 <= new_col < 8:
+                mask |= 1 << square_index(new_row, new_col)
+        table.append(mask)
+    return table
+
+
+def _build_ray_table(direction):
+    """Precompute the empty-board ray from every square in one direction"""
+    dir_row, dir_col = direction
+    table = []
+    for square in range(64):
+        row, col = square_coords(square)
+        mask = 0
+        row, col = row + dir_row, col + dir_col
+        while 0 <= row < 8 and 0 <= col < 8:
+            mask |= 1 << square_index(row, col)
+            row, col = row + dir_row, col + dir_col
+        table.append(mask)
+    return table
+
+
+def _build_pawn_push_table(color, steps):
+    """Precompute the square a pawn reaches by pushing steps squares, 0 where it cannot"""
+    table = []
+    for square in range(64):
+        row, col = square_coords(square)
+        new_row = row + PAWN_DIRECTION[color] * steps
+        if 0 <= new_row < 8 and (steps == 1 or row == PAWN_START_ROW[color]):
+            table.append(1 << square_index(new_row, col))
+        else:
+            table.append(0)
+    return table
+
+
+KNIGHT_ATTACKS = _build_jump_table(KNIGHT_OFFSETS)
+KING_ATTACKS = _build_jump_table(KING_OFFSETS)
+PAWN_ATTACKS = {
+    color: _build_jump_table([(direction, -1), (direction, 1)])
+    for color, direction in PAWN_DIRECTION.items()
+}
+PAWN_PUSHES = {color: _build_pawn_push_table(color, 1) for color in COLORS}
+PAWN_DOUBLE_PUSHES = {color: _build_pawn_push_table(color, 2) for color in COLORS}
+PROMOTION_RANK = {"white": 0xFF, "black": 0xFF << 56}  # Row 0 for white pawns, row 7 for black
+
+# Rays pointing towards higher square indices find their blocker with the lowest
+# set bit, rays pointing towards lower indices with the highest set bit.
+RAYS = {direction: _build_ray_table(direction) for direction in STRAIGHT_DIRECTIONS + DIAGONAL_DIRECTIONS}
+POSITIVE_RAY = {direction: direction[0] * 8 + direction[1] > 0 for direction in RAYS}
+
+
+def first_blocker(direction, square, occupied):
+    """Get the first occupied square along a ray from square, or None"""
+    blockers = RAYS[direction][square] & occupied
+    if not blockers:
+        return None
+    if POSITIVE_RAY[direction]:
+        return (blockers & -blockers).bit_length() - 1
+    return blockers.bit_length() - 1
+
+
+# (ray table, points towards higher indices) per direction, for the inner loop of ray_attacks
+STRAIGHT_RAYS = [(RAYS[direction], POSITIVE_RAY[direction]) for direction in STRAIGHT_DIRECTIONS]
+DIAGONAL_RAYS = [(RAYS[direction], POSITIVE_RAY[direction]) for direction in DIAGONAL_DIRECTIONS]
+
+
+def ray_attacks(square, occupied, rays):
+    """Classical ray lookup: sliding attacks from square stopped by the first blocker"""
+    attacks = 0
+    for table, positive in rays:
+        ray = table[square]
+        blockers = ray & occupied
+        if blockers:
+            if positive:
+                ray ^= table[(blockers & -blockers).bit_length() - 1]
+            else:
+                ray ^= table[blockers.bit_length() - 1]
+        attacks |= ray
+    return attacks
+
+
+def rook_attacks(square, occupied):
+    """Get straight sliding attacks from a square"""
+    return ray_attacks(square, occupied, STRAIGHT_RAYS)
+
+
+def bishop_attacks(square, occupied):
+    """Get diagonal sliding attacks from a square"""
+    return ray_attacks(square, occupied, DIAGONAL_RAYS)
+
+
+class Bitboards:
+    """Board occupancy stored as one 64-bit integer per color and piece type"""
+
+    def __init__(self):
+        self.pieces = {(color, piece_type): 0 for color in COLORS for piece_type in PIECE_TYPES}
+        self.occupancy = {color: 0 for color in COLORS}
+        self.mailbox = [None] * 64  # (color, piece type) per square
+
+    @classmethod
+    def from_board(cls, board):
+        """Build bitboards from an 8x8 list of Piece objects"""
+        bitboards = cls()
+        for row in range(8):
+            for col in range(8):
+                piece = board[row][col]
+                if piece:
+                    square = square_index(row, col)
+                    bit = 1 << square
+                    bitboards.pieces[(piece.color, piece.position)] |= bit
+                    bitboards.occupancy[piece.color] |= bit
+                    bitboards.mailbox[square] = (piece.color, piece.position)
+        return bitboards
+
+    @property
+    def occupied(self):
+        """Bitboard of every occupied square"""
+        return self.occupancy["white"] | self.occupancy["black"]
+
+    def move_piece(self, from_square, to_square):
+        """Move a piece between squares, removing anything on the target square"""
+        color, piece_type = self.mailbox[from_square]
+        from_bit = 1 << from_square
+        to_bit = 1 << to_square
+
+        captured = self.mailbox[to_square]
+        if captured:
+            self.pieces[captured] ^= to_bit
+            self.occupancy[captured[0]] ^= to_bit
+
+        self.pieces[(color, piece_type)] ^= from_bit | to_bit
+        self.occupancy[color] ^= from_bit | to_bit
+        self.mailbox[to_square] = (color, piece_type)
+        self.mailbox[from_square] = None
+
+    def unmove_piece(self, from_square, to_square, captured):
+        """Undo move_piece, putting the captured (color, piece type) back on the target square"""
+        color, piece_type = self.mailbox[to_square]
+        move_bits = (1 << from_square) | (1 << to_square)
+        self.pieces[(color, piece_type)] ^= move_bits
+        self.occupancy[color] ^= move_bits
+        self.mailbox[from_square] = (color, piece_type)
+        self.mailbox[to_square] = captured
+
+        if captured:
+            to_bit = 1 << to_square
+            self.pieces[captured] |= to_bit
+            self.occupancy[captured[0]] |= to_bit
+
+    def replace_piece(self, square, color, piece_type):
+        """Swap the piece on an occupied square for another piece of the same color"""
+        bit = 1 << square
+        self.pieces[self.mailbox[square]] ^= bit
+        self.pieces[(color, piece_type)] |= bit
+        self.mailbox[square] = (color, piece_type)
+
+    def attacks_from(self, square, color, piece_type):
+        """Get the squares a piece attacks from a square, ignoring who stands on them"""
+        if piece_type == "pawn":
+            return PAWN_ATTACKS[color][square]
+        if piece_type == "knight":
+            return KNIGHT_ATTACKS[square]
+        if piece_type == "king":
+            return KING_ATTACKS[square]
+        occupied = self.occupied
+        if piece_type == "rook":
+            return rook_attacks(square, occupied)
+        if piece_type == "bishop":
+            return bishop_attacks(square, occupied)
+        return rook_attacks(square, occupied) | bishop_attacks(square, occupied)
+
+    def moves_from(self, square):
+        """Get the pseudo-legal target squares of the piece on a square as a bitboard"""
+        color, piece_type = self.mailbox[square]
+        if piece_type != "pawn":
+            return self.attacks_from(square, color, piece_type) & ~self.occupancy[color]
+
+        enemy = "black" if color == "white" else "white"
+        targets = PAWN_ATTACKS[color][square] & self.occupancy[enemy]
+        occupied = self.occupied
+        push = PAWN_PUSHES[color][square]
+        if push and not push & occupied:
+            targets |= push
+            double_push = PAWN_DOUBLE_PUSHES[color][square]
+            if double_push and not double_push & occupied:
+                targets |= double_push
+        return targets
+
+    def get_valid_moves(self, row, col):
+        """Get the same (row, col) targets as Piece.get_valid_moves for the piece on a square"""
+        return [square_coords(target) for target in iter_bits(self.moves_from(square_index(row, col)))]
+
+    def is_square_attacked(self, square, by_color, occupied=None):
+        """Check if any piece of by_color attacks the square.
+
+        occupied overrides the occupancy the sliders are stopped by, so a king
+        can be lifted off the board to test the squares behind it.
+        """
+        defender = "black" if by_color == "white" else "white"
+        if PAWN_ATTACKS[defender][square] & self.pieces[(by_color, "pawn")]:
+            return True
+        if KNIGHT_ATTACKS[square] & self.pieces[(by_color, "knight")]:
+            return True
+        if KING_ATTACKS[square] & self.pieces[(by_color, "king")]:
+            return True
+        queens = self.pieces[(by_color, "queen")]
+        if occupied is None:
+            occupied = self.occupied
+        if rook_attacks(square, occupied) & (self.pieces[(by_color, "rook")] | queens):
+            return True
+        return bool(bishop_attacks(square, occupied) & (self.pieces[(by_color, "bishop")] | queens))
+
+    def king_square(self, color):
+        """Get the square of the king of the given color, or None"""
+        king = self.pieces[(color, "king")]
+        return king.bit_length() - 1 if king else None
+
+    def is_king_in_check(self, color):
+        """Check if the king of the given color is attacked"""
+        king_square = self.king_square(color)
+        if king_square is None:
+            return False
+        opponent_color = "black" if color == "white" else "white"
+        return self.is_square_attacked(king_square, opponent_color)
+
+    def pins_and_checkers(self, color, king_square):
+        """Find the pieces checking the king on king_square and the pieces pinned to it.
+
+        Returns (checkers, evasion_mask, pin_masks) where checkers is a bitboard
+        of the checking pieces, evasion_mask the squares a non-king piece may
+        move to in order to capture or block a single checker, and pin_masks
+        maps each pinned square to the line it may still move along.
+        """
+        enemy = "black" if color == "white" else "white"
+        checkers = (
+            (PAWN_ATTACKS[color][king_square] & self.pieces[(enemy, "pawn")])
+            | (KNIGHT_ATTACKS[king_square] & self.pieces[(enemy, "knight")])
+            | (KING_ATTACKS[king_square] & self.pieces[(enemy, "king")])
+        )
+        evasion_mask = checkers
+        pin_masks = {}
+
+        # The first piece on each ray from the king checks it if it is an enemy
+        # slider, or is pinned if it is our own and an enemy slider stands behind it
+        occupied = self.occupied
+        queens = self.pieces[(enemy, "queen")]
+        for directions, slider_type in ((STRAIGHT_DIRECTIONS, "rook"), (DIAGONAL_DIRECTIONS, "bishop")):
+            sliders = self.pieces[(enemy, slider_type)] | queens
+            for direction in directions:
+                blocker = first_blocker(direction, king_square, occupied)
+                if blocker is None:
+                    continue
+                line = RAYS[direction][king_square] ^ RAYS[direction][blocker]
+                if sliders >> blocker & 1:
+                    checkers |= 1 << blocker
+                    evasion_mask |= line
+                elif self.occupancy[color] >> blocker & 1:
+                    pinner = first_blocker(direction, blocker, occupied)
+                    if pinner is not None and sliders >> pinner & 1:
+                        pin_masks[blocker] = line | RAYS[direction][blocker] ^ RAYS[direction][pinner]
+        return checkers, evasion_mask, pin_masks
+
+    def _king_targets(self, square, targets):
+        """Keep the king targets no enemy piece attacks"""
+        enemy = "black" if self.mailbox[square][0] == "white" else "white"
+        # Lift the king off the board so sliders see through its square
+        occupied = self.occupied ^ (1 << square)
+        legal = 0
+        for target in iter_bits(targets):
+            if not self.is_square_attacked(target, enemy, occupied):
+                legal |= 1 << target
+        return legal
+
+    def _legal_targets(self, square, targets, king_square, checks):
+        """Remove the targets that would leave the mover's king in check"""
+        if king_square is None:
+            return targets  # Without a king every pseudo-legal move stands
+        if square == king_square:
+            return self._king_targets(square, targets)
+
+        checkers, evasion_mask, pin_masks = checks
+        if checkers:
+            if checkers & (checkers - 1):
+                return 0  # Double check, only the king can move
+            targets &= evasion_mask
+        if square in pin_masks:
+            targets &= pin_masks[square]
+        return targets
+
+    def legal_move_masks(self, color):
+        """Get a (from_square, target_mask) pair for every piece of a color with a legal move.
+
+        This is the move generator's native output. Perft and the search read
+        it directly, so no target square is turned into a tuple unless the
+        move is actually played.
+        """
+        king_square = self.king_square(color)
+        moves = []
+        if king_square is None:
+            for square in iter_bits(self.occupancy[color]):
+                targets = self.moves_from(square)
+                if targets:
+                    moves.append((square, targets))
+            return moves
+
+        checkers, evasion_mask, pin_masks = self.pins_and_checkers(color, king_square)
+        targets = self._king_targets(king_square, self.moves_from(king_square))
+        if targets:
+            moves.append((king_square, targets))
+        if checkers & (checkers - 1):
+            return moves  # Double check, only the king can move
+
+        for square in iter_bits(self.occupancy[color] & ~(1 << king_square)):
+            targets = self.moves_from(square)
+            if checkers:
+                targets &= evasion_mask
+            if square in pin_masks:
+                targets &= pin_masks[square]
+            if targets:
+                moves.append((square, targets))
+        return moves
+
+    def legal_moves(self, color):
+        """Get a dict mapping each (row, col) of a color to its legal target squares"""
+        masks = dict(self.legal_move_masks(color))
+        return {
+            SQUARE_COORDS[square]: [SQUARE_COORDS[target] for target in iter_bits(masks.get(square, 0))]
+            for square in iter_bits(self.occupancy[color])
+        }
+
+    def is_legal_move(self, from_square, to_square):
+        """Check that a move does not leave the mover's own king in check"""
+        color = self.mailbox[from_square][0]
+        king_square = self.king_square(color)
+        checks = self.pins_and_checkers(color, king_square) if king_square is not None else None
+        return bool(self._legal_targets(from_square, 1 << to_square, king_square, checks))
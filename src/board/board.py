@@ -1,23 +1,18 @@
 import os
 from config.settings import *
 import pygame
-from src.pieces.piece import Piece
-from src.pieces.rook import Rook
-from src.pieces.knight import Knight
-from src.pieces.bishop import Bishop
-from src.pieces.queen import Queen
-from src.pieces.king import King
-from src.pieces.pawn import Pawn
+from src.board.position import PIECE_CLASSES, create_board  # noqa: F401 - re-exported for older imports
 
 
-def load_pieces():
-    """Loads piece images with high quality"""
-    pieces = {}
+def load_pieces(sizes=(PIECE_SIZE, CAPTURED_PIECE_SIZE, PROMOTION_PIECE_SIZE)):
+    """Loads piece images with high quality at every size the UI draws them.
+
+    Returns a sprite atlas mapping each size to a dict of images keyed like
+    "white_pawn", so drawing never has to scale a piece.
+    """
+    atlas = {size: {} for size in sizes}
     piece_types = ["bishop", "king", "knight", "pawn", "queen", "rook"]
     colors = ["BLACK", "WHITE"]
-    
-    # Calculate piece size based on square size and scale factor
-    piece_size = int(SQUARE_SIZE * PIECE_SCALE)
 
     for color in colors:
         for piece_type in piece_types:
@@ -25,53 +20,18 @@ def load_pieces():
             path = os.path.join("assets", "images", "pieces", filename)
 
             try:
-                # Load SVG at a larger size first for better quality
-                temp_size = piece_size * 2  # Load at 2x size initially
-                image = pygame.image.load(path)
-                image = pygame.transform.smoothscale(image, (temp_size, temp_size))
-                # Then scale down to desired size for better anti-aliasing
-                image = pygame.transform.smoothscale(image, (piece_size, piece_size))
-                pieces[f"{color.lower()}_{piece_type}"] = image
+                source = pygame.image.load(path)
             except pygame.error as e:
                 print(f"Error: Could not load {filename} - {e}")
+                continue
 
-    return pieces
-
-
-def create_board():
-    """Creates a chess board in starting position"""
-    board = [[None for _ in range(8)] for _ in range(8)]
-    
-    # Map piece names to their classes
-    piece_classes = {
-        "rook": Rook,
-        "knight": Knight,
-        "bishop": Bishop,
-        "queen": Queen,
-        "king": King,
-        "pawn": Pawn
-    }
-
-    # Initial piece arrangement
-    piece_order = ["rook", "knight", "bishop", "queen", "king", "bishop", "knight", "rook"]
-
-    # Place black pieces
-    for col in range(8):
-        # Create the specific piece type for back rank
-        piece_class = piece_classes[piece_order[col]]
-        board[0][col] = piece_class("black", piece_order[col])
-        # Create pawns
-        board[1][col] = Pawn("black", "pawn")
-
-    # Place white pieces
-    for col in range(8):
-        # Create the specific piece type for back rank
-        piece_class = piece_classes[piece_order[col]]
-        board[7][col] = piece_class("white", piece_order[col])
-        # Create pawns
-        board[6][col] = Pawn("white", "pawn")
+            for size in sizes:
+                # Scale to 2x size first, then down to the desired size for better anti-aliasing
+                image = pygame.transform.smoothscale(source, (size * 2, size * 2))
+                image = pygame.transform.smoothscale(image, (size, size))
+                atlas[size][f"{color.lower()}_{piece_type}"] = image
 
-    return board
+    return atlas
 
 
 def draw_board(screen):
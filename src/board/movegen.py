@@ -0,0 +1,136 @@
+"""Legal move generation driven by pins and checkers.
+
+Pins and checking pieces are computed once per position by looking outward
+from the king. Pseudo-legal moves from the Piece classes are then filtered
+against them directly, so no move has to be played on the board and undone
+to find out whether it leaves the king in check.
+"""
+from src.board.attacks import (
+    DIAGONAL_DIRECTIONS,
+    KING_OFFSETS,
+    KNIGHT_OFFSETS,
+    STRAIGHT_DIRECTIONS,
+    is_square_attacked,
+    locate_king,
+)
+
+
+def find_pins_and_checks(board, color, king_pos):
+    """Find the pieces checking the king and the pieces pinned to it.
+
+    Returns (checkers, evasion_squares, pins) where checkers is a list of
+    attacking squares, evasion_squares is the set of squares a non-king piece
+    may move to in order to capture or block a single checker, and pins maps
+    each pinned square to the set of squares it may still move to.
+    """
+    opponent_color = "black" if color == "white" else "white"
+    king_row, king_col = king_pos
+    checkers = []
+    evasion_squares = set()
+    pins = {}
+
+    # Pawn, knight and king checks can only be answered by capturing the checker
+    pawn_row = king_row - 1 if color == "white" else king_row + 1
+    for col in (king_col - 1, king_col + 1):
+        if 0 <= pawn_row < 8 and 0 <= col < 8:
+            piece = board[pawn_row][col]
+            if piece and piece.color == opponent_color and piece.position == "pawn":
+                checkers.append((pawn_row, col))
+                evasion_squares.add((pawn_row, col))
+
+    for offsets, piece_type in ((KNIGHT_OFFSETS, "knight"), (KING_OFFSETS, "king")):
+        for dir_row, dir_col in offsets:
+            row, col = king_row + dir_row, king_col + dir_col
+            if 0 <= row < 8 and 0 <= col < 8:
+                piece = board[row][col]
+                if piece and piece.color == opponent_color and piece.position == piece_type:
+                    checkers.append((row, col))
+                    evasion_squares.add((row, col))
+
+    # Walk each ray from the king: an enemy slider behind zero own pieces
+    # gives check, behind exactly one own piece it pins that piece
+    sliders = [(direction, ("rook", "queen")) for direction in STRAIGHT_DIRECTIONS]
+    sliders += [(direction, ("bishop", "queen")) for direction in DIAGONAL_DIRECTIONS]
+    for (dir_row, dir_col), slider_types in sliders:
+        ray = []
+        pinned_square = None
+        row, col = king_row + dir_row, king_col + dir_col
+        while 0 <= row < 8 and 0 <= col < 8:
+            ray.append((row, col))
+            piece = board[row][col]
+            if piece:
+                if piece.color == color:
+                    if pinned_square:
+                        break
+                    pinned_square = (row, col)
+                else:
+                    if piece.position in slider_types:
+                        if pinned_square:
+                            pins[pinned_square] = set(ray)
+                        else:
+                            checkers.append((row, col))
+                            evasion_squares.update(ray)
+                    break
+            row, col = row + dir_row, col + dir_col
+
+    return checkers, evasion_squares, pins
+
+
+def _own_squares(board, color):
+    """Scan the board for the squares holding pieces of color"""
+    return [
+        (row, col) for row in range(8) for col in range(8)
+        if board[row][col] and board[row][col].color == color
+    ]
+
+
+def generate_legal_moves(board, color, king_pos=None, squares=None):
+    """Generate every legal move for a color.
+
+    Returns a dict mapping each (row, col) holding a piece of that color to the
+    list of legal target squares, in the same order as Piece.get_valid_moves.
+    squares lists the squares holding the color's pieces when the caller
+    tracks them, otherwise the board is scanned for them.
+    """
+    if king_pos is None:
+        king_pos = locate_king(board, color)
+    if squares is None:
+        squares = _own_squares(board, color)
+
+    legal_moves = {}
+    if king_pos is None:
+        # Without a king nothing can be in check, every pseudo-legal move stands
+        for row, col in squares:
+            legal_moves[(row, col)] = board[row][col].get_valid_moves(board, row, col)
+        return legal_moves
+
+    opponent_color = "black" if color == "white" else "white"
+    checkers, evasion_squares, pins = find_pins_and_checks(board, color, king_pos)
+    double_check = len(checkers) > 1
+
+    for row, col in squares:
+        piece = board[row][col]
+        moves = piece.get_valid_moves(board, row, col)
+        if (row, col) == king_pos:
+            # Lift the king off the board so sliders see through its square
+            board[row][col] = None
+            try:
+                moves = [
+                    move for move in moves
+                    if not is_square_attacked(board, move[0], move[1], opponent_color)
+                ]
+            finally:
+                board[row][col] = piece
+        elif double_check:
+            moves = []
+        else:
+            if checkers:
+                moves = [move for move in moves if move in evasion_squares]
+            if (row, col) in pins:
+                pin_line = pins[(row, col)]
+                moves = [move for move in moves if move in pin_line]
+
+        legal_moves[(row, col)] = moves
+
+    return legal_moves
+
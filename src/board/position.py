@@ -0,0 +1,59 @@
+from src.pieces.bishop import Bishop
+from src.pieces.king import King
+from src.pieces.knight import Knight
+from src.pieces.pawn import Pawn
+from src.pieces.queen import Queen
+from src.pieces.rook import Rook
+
+# Map piece names to their classes
+PIECE_CLASSES = {
+    "rook": Rook,
+    "knight": Knight,
+    "bishop": Bishop,
+    "queen": Queen,
+    "king": King,
+    "pawn": Pawn
+}
+
+# The shared instance of every piece, boards reference these instead of making their own
+PIECES = {
+    (color, piece_type): piece_class(color, piece_type)
+    for color in ("white", "black")
+    for piece_type, piece_class in PIECE_CLASSES.items()
+}
+
+
+def get_piece(color, piece_type):
+    """Get the shared piece of a color and type"""
+    return PIECES[(color, piece_type)]
+
+
+def list_pieces(board):
+    """Map each color to a dict of the (row, col) squares it occupies and the piece type on each"""
+    pieces = {"white": {}, "black": {}}
+    for row in range(8):
+        for col in range(8):
+            piece = board[row][col]
+            if piece:
+                pieces[piece.color][(row, col)] = piece.position
+    return pieces
+
+
+def create_board():
+    """Creates a chess board in starting position"""
+    board = [[None for _ in range(8)] for _ in range(8)]
+
+    # Initial piece arrangement
+    piece_order = ["rook", "knight", "bishop", "queen", "king", "bishop", "knight", "rook"]
+
+    # Place black pieces
+    for col in range(8):
+        board[0][col] = get_piece("black", piece_order[col])
+        board[1][col] = get_piece("black", "pawn")
+
+    # Place white pieces
+    for col in range(8):
+        board[7][col] = get_piece("white", piece_order[col])
+        board[6][col] = get_piece("white", "pawn")
+
+    return board
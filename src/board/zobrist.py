@@ -0,0 +1,40 @@
+"""Zobrist hashing of board positions.
+
+Every (color, piece type, square) gets a random 64-bit key, as does black
+being the side to move. A position hash is the XOR of the keys that apply,
+so a move only needs a few XORs to update it instead of rescanning the board.
+
+Which pieces have moved is not hashed: without castling it never changes
+the legal moves, and a piece that moves out and back must give the same
+hash for repetition detection.
+"""
+import random
+
+COLORS = ["white", "black"]
+PIECE_TYPES = ["pawn", "knight", "bishop", "rook", "queen", "king"]
+
+# Fixed seed so hashes are stable between runs and can be stored on disk
+_rng = random.Random(0x3DC4E55)
+
+PIECE_KEYS = {
+    (color, piece_type): [_rng.getrandbits(64) for _ in range(64)]
+    for color in COLORS
+    for piece_type in PIECE_TYPES
+}
+BLACK_TO_MOVE_KEY = _rng.getrandbits(64)
+
+
+def piece_key(piece, row, col):
+    """Get the key of a piece standing on a square"""
+    return PIECE_KEYS[(piece.color, piece.position)][row * 8 + col]
+
+
+def compute_hash(board, current_turn):
+    """Compute the hash of a position from scratch"""
+    position_hash = BLACK_TO_MOVE_KEY if current_turn == "black" else 0
+    for row in range(8):
+        for col in range(8):
+            piece = board[row][col]
+            if piece:
+                position_hash ^= piece_key(piece, row, col)
+    return position_hash
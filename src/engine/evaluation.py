@@ -0,0 +1,103 @@
+"""Static evaluation: material plus piece-square tables.
+
+Tables are written from white's point of view with row 0 as the 8th rank,
+matching the board layout, and are mirrored vertically for black.
+"""
+
+PIECE_VALUES = {"pawn": 100, "knight": 320, "bishop": 330, "rook": 500, "queen": 900, "king": 0}
+
+PIECE_SQUARE_TABLES = {
+    "pawn": [
+        [0, 0, 0, 0, 0, 0, 0, 0],
+        [50, 50, 50, 50, 50, 50, 50, 50],
+        [10, 10, 20, 30, 30, 20, 10, 10],
+        [5, 5, 10, 25, 25, 10, 5, 5],
+        [0, 0, 0, 20, 20, 0, 0, 0],
+        [5, -5, -10, 0, 0, -10, -5, 5],
+        [5, 10, 10, -20, -20, 10, 10, 5],
+        [0, 0, 0, 0, 0, 0, 0, 0]
+    ],
+    "knight": [
+        [-50, -40, -30, -30, -30, -30, -40, -50],
+        [-40, -20, 0, 0, 0, 0, -20, -40],
+        [-30, 0, 10, 15, 15, 10, 0, -30],
+        [-30, 5, 15, 20, 20, 15, 5, -30],
+        [-30, 0, 15, 20, 20, 15, 0, -30],
+        [-30, 5, 10, 15, 15, 10, 5, -30],
+        [-40, -20, 0, 5, 5, 0, -20, -40],
+        [-50, -40, -30, -30, -30, -30, -40, -50]
+    ],
+    "bishop": [
+        [-20, -10, -10, -10, -10, -10, -10, -20],
+        [-10, 0, 0, 0, 0, 0, 0, -10],
+        [-10, 0, 5, 10, 10, 5, 0, -10],
+        [-10, 5, 5, 10, 10, 5, 5, -10],
+        [-10, 0, 10, 10, 10, 10, 0, -10],
+        [-10, 10, 10, 10, 10, 10, 10, -10],
+        [-10, 5, 0, 0, 0, 0, 5, -10],
+        [-20, -10, -10, -10, -10, -10, -10, -20]
+    ],
+    "rook": [
+        [0, 0, 0, 0, 0, 0, 0, 0],
+        [5, 10, 10, 10, 10, 10, 10, 5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [0, 0, 0, 5, 5, 0, 0, 0]
+    ],
+    "queen": [
+        [-20, -10, -10, -5, -5, -10, -10, -20],
+        [-10, 0, 0, 0, 0, 0, 0, -10],
+        [-10, 0, 5, 5, 5, 5, 0, -10],
+        [-5, 0, 5, 5, 5, 5, 0, -5],
+        [0, 0, 5, 5, 5, 5, 0, -5],
+        [-10, 5, 5, 5, 5, 5, 0, -10],
+        [-10, 0, 5, 0, 0, 0, 0, -10],
+        [-20, -10, -10, -5, -5, -10, -10, -20]
+    ],
+    "king": [
+        [-30, -40, -40, -50, -50, -40, -40, -30],
+        [-30, -40, -40, -50, -50, -40, -40, -30],
+        [-30, -40, -40, -50, -50, -40, -40, -30],
+        [-30, -40, -40, -50, -50, -40, -40, -30],
+        [-20, -30, -30, -40, -40, -30, -30, -20],
+        [-10, -20, -20, -20, -20, -20, -20, -10],
+        [20, 20, 0, 0, 0, 0, 20, 20],
+        [20, 30, 10, 0, 0, 10, 30, 20]
+    ]
+}
+
+
+def piece_square_value(piece, row, col):
+    """Get the material plus positional value of a piece on a square"""
+    table_row = row if piece.color == "white" else 7 - row
+    return PIECE_VALUES[piece.position] + PIECE_SQUARE_TABLES[piece.position][table_row][col]
+
+
+def evaluate(board, color, piece_lists=None):
+    """Score the board in centipawns from the point of view of color.
+
+    With the per-color piece lists of a GameState only the occupied squares
+    are visited instead of all 64.
+    """
+    if piece_lists is not None:
+        score = 0
+        for piece_color, pieces in piece_lists.items():
+            sign = 1 if piece_color == color else -1
+            for (row, col), piece_type in pieces.items():
+                table_row = row if piece_color == "white" else 7 - row
+                score += sign * (PIECE_VALUES[piece_type] + PIECE_SQUARE_TABLES[piece_type][table_row][col])
+        return score
+
+    score = 0
+    for row in range(8):
+        for col in range(8):
+            piece = board[row][col]
+            if piece:
+                if piece.color == color:
+                    score += piece_square_value(piece, row, col)
+                else:
+                    score -= piece_square_value(piece, row, col)
+    return score
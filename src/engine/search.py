@@ -0,0 +1,247 @@
+"""Computer opponent: negamax alpha-beta search with iterative deepening.
+
+Moves come from GameState's legal move generator and are played with
+make_move/unmake_move, so the search never copies the board. Moves are
+ordered by the transposition table move, MVV-LVA for captures, killer
+moves and the history heuristic.
+"""
+import time
+
+from config.settings import AI_MAX_DEPTH, AI_TT_SIZE_MB
+from src.board.bitboard import PROMOTION_RANK, SQUARE_COORDS, iter_bits
+from src.engine.evaluation import PIECE_VALUES, evaluate
+from src.engine.transposition import EXACT, LOWER_BOUND, UPPER_BOUND, TranspositionTable
+from src.game.move import Move
+from src.game.state import FIFTY_MOVE_PLIES
+
+MATE_SCORE = 100000
+MATE_THRESHOLD = MATE_SCORE - 1000  # Scores beyond this are mates, stored relative to the node
+INFINITY = 1000000
+SEARCH_PROMOTIONS = ["queen", "knight"]  # Rook and bishop promotions are never better than a queen
+TIME_CHECK_INTERVAL = 1023  # Check the clock every 1024 nodes
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget runs out"""
+
+
+class Searcher:
+    """Finds the best move for the side to move within a time budget"""
+
+    def __init__(self, max_depth=AI_MAX_DEPTH, tt_size_mb=AI_TT_SIZE_MB):
+        self.max_depth = max_depth
+        self.tt = TranspositionTable(tt_size_mb)
+        self.killers = {}
+        self.history = {}
+        self.nodes = 0
+        self.deadline = None
+        self.last_info = None
+
+    def find_best_move(self, state, time_budget):
+        """Search the state for up to time_budget seconds.
+
+        Returns the best (from_pos, to_pos, promotion) found at the deepest
+        completed iteration, or None when the side to move has no legal move.
+        """
+        start = time.perf_counter()
+        self.deadline = start + time_budget
+        self.nodes = 0
+        self.killers = {}
+        self.tt.new_search()
+        # Age the history table so old cutoffs matter less than recent ones
+        self.history = {key: value // 2 for key, value in self.history.items() if value > 1}
+
+        root_moves = self.generate_moves(state)
+        if not root_moves:
+            return None
+
+        best_move = root_moves[0]
+        best_score = 0
+        completed_depth = 0
+        for depth in range(1, self.max_depth + 1):
+            try:
+                best_score, best_move = self._search_root(state, root_moves, depth, best_move)
+            except SearchTimeout:
+                break
+            completed_depth = depth
+            if abs(best_score) >= MATE_SCORE - self.max_depth:
+                break  # A forced mate was found, deeper search cannot improve on it
+
+        elapsed = time.perf_counter() - start
+        self.last_info = {
+            "depth": completed_depth,
+            "score": best_score,
+            "nodes": self.nodes,
+            "seconds": elapsed,
+            "nps": self.nodes / elapsed if elapsed > 0 else 0.0,
+            "tt": self.tt.stats()
+        }
+        return best_move
+
+    def generate_moves(self, state):
+        """List legal (from_pos, to_pos, promotion) moves for the side to move"""
+        board = state.board
+        promotion_rank = PROMOTION_RANK[state.current_turn]
+        moves = []
+        for from_square, targets in state.legal_move_masks(state.current_turn):
+            from_pos = SQUARE_COORDS[from_square]
+            promotes = targets & promotion_rank and board[from_pos[0]][from_pos[1]].position == "pawn"
+            for to_square in iter_bits(targets):
+                to_pos = SQUARE_COORDS[to_square]
+                if promotes and promotion_rank >> to_square & 1:
+                    moves.extend((from_pos, to_pos, promotion) for promotion in SEARCH_PROMOTIONS)
+                else:
+                    moves.append((from_pos, to_pos, None))
+        return moves
+
+    def _order_moves(self, state, moves, ply, best_move=None):
+        """Sort moves so the most promising ones are searched first"""
+        board = state.board
+        killers = self.killers.get(ply, ())
+        color = state.current_turn
+
+        def score(move):
+            from_pos, to_pos, promotion = move
+            if move == best_move:
+                return 3 * INFINITY
+            victim = board[to_pos[0]][to_pos[1]]
+            if victim:
+                # MVV-LVA: most valuable victim first, least valuable attacker first
+                attacker = board[from_pos[0]][from_pos[1]]
+                return 2 * INFINITY + 10 * PIECE_VALUES[victim.position] - PIECE_VALUES[attacker.position]
+            if promotion:
+                return 2 * INFINITY + PIECE_VALUES[promotion]
+            if move in killers:
+                return INFINITY + (1 if move == killers[0] else 0)
+            return self.history.get((color, from_pos, to_pos), 0)
+
+        return sorted(moves, key=score, reverse=True)
+
+    def _check_time(self):
+        """Count a node and abort the search when the deadline has passed"""
+        self.nodes += 1
+        if not self.nodes & TIME_CHECK_INTERVAL and time.perf_counter() > self.deadline:
+            raise SearchTimeout()
+
+    def _search_root(self, state, root_moves, depth, best_move):
+        """Search every root move to the given depth and return (score, move)"""
+        alpha = -INFINITY
+        best = best_move
+        for move in self._order_moves(state, root_moves, 0, best_move):
+            state.make_move(Move(*move))
+            try:
+                score = -self._negamax(state, depth - 1, -INFINITY, -alpha, 1)
+            finally:
+                state.unmake_move()
+            if score > alpha:
+                alpha = score
+                best = move
+        self.tt.store(state.hash, depth, EXACT, alpha, best)
+        return alpha, best
+
+    def _negamax(self, state, depth, alpha, beta, ply):
+        """Score the position for the side to move with alpha-beta pruning"""
+        self._check_time()
+        # A repeated position is scored as a draw, the side ahead will avoid it
+        if state.halfmove_clock >= FIFTY_MOVE_PLIES or state.repetition_count():
+            return 0
+        if depth <= 0:
+            return self._quiescence(state, alpha, beta)
+
+        original_alpha = alpha
+        tt_move = None
+        entry = self.tt.probe(state.hash)
+        if entry:
+            tt_move = entry.best_move
+            if entry.depth >= depth:
+                score = self._score_from_tt(entry.score, ply)
+                if entry.bound == EXACT:
+                    return score
+                if entry.bound == LOWER_BOUND and score >= beta:
+                    return score
+                if entry.bound == UPPER_BOUND and score <= alpha:
+                    return score
+
+        moves = self.generate_moves(state)
+        if not moves:
+            if state.is_king_in_check(state.current_turn):
+                return -MATE_SCORE + ply  # Prefer the quickest mate
+            return 0  # Stalemate
+
+        best_score = -INFINITY
+        best_move = None
+        for move in self._order_moves(state, moves, ply, tt_move):
+            _, to_pos, promotion = move
+            is_quiet = state.board[to_pos[0]][to_pos[1]] is None and not promotion
+            state.make_move(Move(*move))
+            try:
+                score = -self._negamax(state, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                state.unmake_move()
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                if is_quiet:
+                    self._store_cutoff(state.current_turn, move, depth, ply)
+                break
+
+        if best_score <= original_alpha:
+            bound = UPPER_BOUND
+        elif best_score >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        self.tt.store(state.hash, depth, bound, self._score_to_tt(best_score, ply), best_move)
+        return best_score
+
+    def _quiescence(self, state, alpha, beta):
+        """Resolve captures at the horizon so the evaluation is not taken mid-exchange"""
+        self._check_time()
+        stand_pat = evaluate(state.board, state.current_turn, state.piece_lists)
+        if stand_pat >= beta:
+            return stand_pat
+        alpha = max(alpha, stand_pat)
+
+        board = state.board
+        captures = [
+            move for move in self.generate_moves(state)
+            if board[move[1][0]][move[1][1]] is not None or move[2] == "queen"
+        ]
+        for move in self._order_moves(state, captures, None):
+            state.make_move(Move(*move))
+            try:
+                score = -self._quiescence(state, -beta, -alpha)
+            finally:
+                state.unmake_move()
+            if score >= beta:
+                return score
+            alpha = max(alpha, score)
+        return alpha
+
+    def _score_to_tt(self, score, ply):
+        """Store mate scores as distance from this node rather than from the root"""
+        if score > MATE_THRESHOLD:
+            return score + ply
+        if score < -MATE_THRESHOLD:
+            return score - ply
+        return score
+
+    def _score_from_tt(self, score, ply):
+        """Turn a stored mate score back into distance from the root"""
+        if score > MATE_THRESHOLD:
+            return score - ply
+        if score < -MATE_THRESHOLD:
+            return score + ply
+        return score
+
+    def _store_cutoff(self, color, move, depth, ply):
+        """Remember a quiet move that caused a beta cutoff as a killer and in the history table"""
+        killers = self.killers.setdefault(ply, [None, None])
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+        key = (color, move[0], move[1])
+        self.history[key] = self.history.get(key, 0) + depth * depth
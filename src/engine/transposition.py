@@ -0,0 +1,132 @@
+"""Fixed-size transposition table keyed on Zobrist position hashes.
+
+The table holds a bounded number of slots derived from a memory cap in MB and
+the measured size of the largest entry it will hold.
+Each position hash maps to one slot. A new entry replaces the old one when
+the old one is from an earlier search (aging) or was searched less deeply
+(depth-preferred).
+"""
+import sys
+from collections import namedtuple
+
+EXACT = 0
+LOWER_BOUND = 1  # Search failed high: the real score is at least this
+UPPER_BOUND = 2  # Search failed low: the real score is at most this
+
+SLOT_SIZE_BYTES = 8  # The slot list's pointer to an entry
+
+TTEntry = namedtuple("TTEntry", ["key", "depth", "bound", "score", "best_move", "age"])
+
+
+def deep_sizeof(value):
+    """Get the bytes held by a value and every tuple, list, set and dict inside it.
+
+    Objects reached twice are counted once. Shared objects such as small ints
+    and interned strings are still counted, so the result errs on the high side.
+    """
+    seen = set()
+    stack = [value]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (tuple, list, set, frozenset)):
+            stack.extend(item)
+    return total
+
+
+def value_entry_size(largest_value):
+    """Get the cost of one filled slot when put_value stores values no larger than largest_value"""
+    return SLOT_SIZE_BYTES + deep_sizeof(TTEntry(2 ** 64 - 1, 0, EXACT, largest_value, None, 0))
+
+
+# Largest search entry: a full 64-bit key, a large score and a promotion move
+# kept alive only by the table. Every number differs so none is counted once for two fields
+SEARCH_ENTRY_SIZE_BYTES = SLOT_SIZE_BYTES + deep_sizeof(
+    TTEntry(2 ** 64 - 1, 1, UPPER_BOUND, 10 ** 6, ((3, 4), (5, 6), "knight"), 7)
+)
+
+
+class TranspositionTable:
+    """Bounded hash table of search results with hit/miss statistics.
+
+    Besides search results it can cache any per-position value: callers such
+    as the position analysis store the value as the score with depth 0 and
+    pass the entry_size measured with value_entry_size.
+    """
+
+    def __init__(self, size_mb, entry_size=SEARCH_ENTRY_SIZE_BYTES):
+        self.size_mb = size_mb
+        self.entry_size = entry_size
+        self.capacity = max(1, int(size_mb * 1024 * 1024) // entry_size)
+        self.slots = [None] * self.capacity
+        self.age = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.replacements = 0
+        self.rejections = 0
+
+    def new_search(self):
+        """Age the table so entries from earlier searches are replaced first"""
+        self.age += 1
+
+    def clear(self):
+        """Drop every entry and reset the statistics"""
+        self.slots = [None] * self.capacity
+        self.age = 0
+        self.hits = self.misses = self.stores = self.replacements = self.rejections = 0
+
+    def probe(self, key):
+        """Get the entry stored for a position hash, or None"""
+        entry = self.slots[key % self.capacity]
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(self, key, depth, bound, score, best_move=None):
+        """Store a result unless the slot holds a deeper entry from the current search"""
+        index = key % self.capacity
+        entry = self.slots[index]
+        if entry is not None and entry.key != key:
+            if entry.age == self.age and entry.depth > depth:
+                self.rejections += 1
+                return False
+            self.replacements += 1
+        self.slots[index] = TTEntry(key, depth, bound, score, best_move, self.age)
+        self.stores += 1
+        return True
+
+    def get_value(self, key):
+        """Get a cached per-position value, or None on a miss"""
+        entry = self.probe(key)
+        return entry.score if entry else None
+
+    def put_value(self, key, value):
+        """Cache a per-position value that does not depend on search depth"""
+        self.store(key, 0, EXACT, value)
+
+    def stats(self):
+        """Get hit/miss counts, hit rate and how full the table is"""
+        probes = self.hits + self.misses
+        filled = sum(1 for entry in self.slots if entry is not None)
+        return {
+            "size_mb": self.size_mb,
+            "entry_size": self.entry_size,
+            "capacity": self.capacity,
+            "filled": filled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / probes if probes else 0.0,
+            "stores": self.stores,
+            "replacements": self.replacements,
+            "rejections": self.rejections
+        }
@@ -1,41 +1,50 @@
 import pygame
+from collections import deque
 from src.board.board import *
 from config.settings import *
 from src.utils.logger import logger
-from src.pieces.queen import Queen
-from src.pieces.rook import Rook
-from src.pieces.bishop import Bishop
-from src.pieces.knight import Knight
+from src.engine.search import Searcher
+from src.board.bitboard import iter_bits, square_coords, square_index
+from src.engine.transposition import TranspositionTable, value_entry_size
+from src.game.state import DRAW_REASONS, GameState, get_square_notation
+from src.game.tween import Tween, linear
 from src.utils.game_saver import GameSaver
+from src.utils.journal import JOURNAL_EXTENSION, build_game_record
+from src.utils.save_worker import SaveWorker
+from src.utils.text_cache import TextCache
+
+# Largest value _pack_analysis returns: 16 pieces with full 64-bit target masks
+LARGEST_PACKED_ANALYSIS = (
+    2 ** 64 - 1, True, 63, tuple((square, 2 ** 64 - 1 - square) for square in range(16))
+)
+
 
 class Game:
-    def __init__(self):
+    def __init__(self, computer_color=None):
         pygame.init()
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption(GAME_NAME)
         
         self.clock = pygame.time.Clock()
-        self.board = create_board()
-        self.pieces_images = load_pieces()
+        self.state = GameState()  # White starts first
+        self.piece_atlas = load_pieces()
+        self.pieces_images = self.piece_atlas[PIECE_SIZE]
         
         # Game state
         self.selected_piece = None
         self.selected_square = None
         self.valid_moves = []
-        self.current_turn = "white"  # White starts first
         
         # Animation state
         self.animating_piece = None
-        self.animation_start = None
-        self.animation_end = None
-        self.animation_progress = 0
         self.animation_piece_image = None
+        self.move_tween = None
+        self.capture_fade = None  # Square, image and tween of a captured piece fading out
+        self.tweens = []
         self.pending_move = None
         
-        # Game tracking
-        self.captured_pieces = {"white": [], "black": []}
-        self.move_history = []
-        self.move_count = 1
+        # Clicks made during an animation or the computer's turn, replayed as premoves
+        self.input_queue = deque()
         
         # Timer initialization
         self.time_left = {"white": INITIAL_TIME, "black": INITIAL_TIME}
@@ -46,6 +55,9 @@ class Game:
         self.font_large = pygame.font.Font(None, FONT_SIZE_LARGE)
         self.font_medium = pygame.font.Font(None, FONT_SIZE_MEDIUM)
         self.font_small = pygame.font.Font(None, FONT_SIZE_SMALL)
+        self.text_cache = TextCache(TEXT_CACHE_SIZE)
+        self.board_layer = None  # Static background, built on the first frame
+        self.overlays = self.build_overlays()
         
         # Load sounds
         self.move_sound = pygame.mixer.Sound('assets/sounds/move.mp3')
@@ -57,42 +69,216 @@ class Game:
         self.promotion_color = None
         self.promotion_pieces = ["queen", "rook", "bishop", "knight"]
 
-        # Initialize game saver
+        # Computer opponent, None for human vs human
+        self.computer_color = computer_color
+        self.searcher = Searcher() if computer_color else None
+
+        # Initialize game saver. The journal is started by the first save and
+        # then gets every move appended to it. All file I/O runs on the save
+        # worker so the frame never waits on the disk
         self.game_saver = GameSaver()
+        self.save_worker = SaveWorker()
+        self.journal = None
+        self.moves_since_checkpoint = 0
+        if self.game_saver.catalog_needs_rebuild:
+            self.save_worker.submit(self.game_saver.ensure_catalog)
+
+        # Cached threat/check analysis for the current position, backed by a
+        # bounded table of positions analysed earlier in the game
+        self._analysis_key = None
+        self._analysis = None
+        self.analysis_table = TranspositionTable(
+            ANALYSIS_TABLE_SIZE_MB, entry_size=value_entry_size(LARGEST_PACKED_ANALYSIS)
+        )
+
+        # Screen regions as drawn in the last frame, used to find dirty rectangles
+        self._drawn_regions = None
+        self._full_redraw = True
         
         logger.info("New chess game started - White's turn")
 
+    @property
+    def board(self):
+        """The 8x8 board of the underlying game state"""
+        return self.state.board
+
+    @property
+    def current_turn(self):
+        """Color to move in the underlying game state"""
+        return self.state.current_turn
+
+    @property
+    def moved_mask(self):
+        """Squares whose piece has moved, as a 64-bit mask"""
+        return self.state.moved_mask
+
+    @property
+    def captured_pieces(self):
+        """Pieces captured by each side"""
+        return self.state.captured_pieces
+
+    @property
+    def move_history(self):
+        """Recent moves in text form"""
+        return self.state.move_history
+
+    @property
+    def move_count(self):
+        """Full move number"""
+        return self.state.move_count
+
     def save_current_game(self):
-        """Save the current game state"""
-        filename = self.game_saver.save_game(self)
-        if filename:
-            logger.info(f"Game saved as {filename}")
-            return True
-        return False
+        """Save the current game state in the background.
+
+        The first save starts a journal with a checkpoint of the game that
+        records every move since it began. Moves are appended to it as they are played, so later saves only need to
+        sync the journal to disk. The game is snapshotted here and written by
+        the save worker, which reports back through a message when done.
+        """
+        save_data = self.game_saver.build_save_data(self, self.time_left, self.game_over)
+        if self.journal is None:
+            self.journal = self.game_saver.new_journal()
+            self.moves_since_checkpoint = 0
+            job = self.game_saver.start_journal
+            args = (save_data, build_game_record(self.state))
+        else:
+            job = self.game_saver.sync_journal
+            args = (save_data,)
+        journal = self.journal
+        self.save_worker.submit(job, journal, *args, on_complete=lambda ok: self.finish_save(journal, ok))
+        return True
+
+    def finish_save(self, journal, ok):
+        """Report a finished background save"""
+        if ok:
+            logger.info(f"Game saved as {journal.filename}")
+            self._show_message("Game saved successfully!", 2)
+            return
+        if journal is self.journal and not journal.started:
+            self.journal = None  # The journal never got its checkpoint, start over on the next save
+        self._show_message("Failed to save game!", 2)
+
+    def record_in_journal(self, move):
+        """Append a played move to the journal, with a checkpoint every few moves"""
+        if self.journal is None:
+            return
+        self.submit_journal_write(self.journal.record_move, move, dict(self.time_left))
+        self.moves_since_checkpoint += 1
+        if self.moves_since_checkpoint >= JOURNAL_CHECKPOINT_INTERVAL:
+            self.write_journal_checkpoint()
+        else:
+            self.refresh_journal_catalog()
+
+    def write_journal_checkpoint(self):
+        """Append a snapshot of the whole game to the journal"""
+        save_data = self.game_saver.build_save_data(self, self.time_left, self.game_over)
+        self.submit_journal_write(self.journal.write_checkpoint, save_data, build_game_record(self.state))
+        self.moves_since_checkpoint = 0
+        self.refresh_journal_catalog()
+
+    def refresh_journal_catalog(self):
+        """Queue a refresh of the journal's catalog entry, so listings and searches see the current position"""
+        if self.journal is None:
+            return
+        entry = self.game_saver.catalog_entry(self.state, self.time_left, self.get_outcome())
+        self.save_worker.submit(self.game_saver.refresh_journal, self.journal, entry)
+
+    def submit_journal_write(self, write, *args):
+        """Run a journal write on the save worker, logging instead of raising if it fails"""
+        def job():
+            try:
+                write(*args)
+            except OSError as e:
+                logger.error(f"Error writing game journal: {str(e)}")
+        self.save_worker.submit(job)
+
+    def close_journal(self):
+        """Sync and close the journal of the current game once queued writes are done"""
+        if self.journal is not None:
+            self.save_worker.submit(self.journal.close)
+            self.journal = None
+
+    def close(self):
+        """Finish every queued save and stop the save worker"""
+        self.close_journal()
+        self.save_worker.shutdown()
+
+    def request_load(self, filename=None):
+        """Load a saved game in the background, the most recent one if no filename is given.
+
+        The save is read and rebuilt on the save worker, then swapped in at the
+        start of a later frame. Jobs run in order, so the active journal is
+        synced before the read and a load of it sees every move played.
+        """
+        self.sync_journal_before_read()
+        self.save_worker.submit(self.read_saved_game, filename, on_complete=self.finish_load)
+
+    def sync_journal_before_read(self):
+        """Queue a sync of the active journal ahead of a read of the save files"""
+        if self.journal is not None:
+            self.submit_journal_write(self.journal.sync)
+
+    def finish_load(self, loaded):
+        """Swap in a game read by the save worker and report the result"""
+        if loaded is not None and loaded["filename"] is None:
+            self._show_message("No saved games found!", 2)
+        elif loaded is not None and self.apply_loaded_game(loaded):
+            self._show_message("Game loaded successfully!", 2)
+        else:
+            self._show_message("Failed to load game!", 2)
+
+    def read_saved_game(self, filename=None):
+        """Read a save and rebuild its game state without touching the current game.
+
+        Returns a dict with the filename, the save data and the state, where
+        the state is None if the save could not be read and the filename is
+        None if there was no save to load.
+        """
+        loaded = {"filename": filename, "save_data": None, "state": None}
+        if filename is None:
+            saved_games = self.game_saver.list_saved_games(limit=1)
+            if not saved_games:
+                return loaded
+            loaded["filename"] = saved_games[0]['filename']
+
+        result = self.game_saver.load_game_state(loaded["filename"])
+        if result is not None:
+            loaded["state"], loaded["save_data"] = result
+        return loaded
 
     def load_saved_game(self, filename):
-        """Load a saved game state"""
-        save_data = self.game_saver.load_game(filename)
-        if not save_data:
+        """Load a saved game state, blocking until it is read"""
+        self.sync_journal_before_read()
+        self.save_worker.wait()
+        return self.apply_loaded_game(self.read_saved_game(filename))
+
+    def apply_loaded_game(self, loaded):
+        """Make a game read by read_saved_game the current game"""
+        if loaded["state"] is None:
             return False
 
         try:
-            # Load board state
-            self.board = self._deserialize_board(save_data["board_state"])
-            self.current_turn = save_data["current_turn"]
-            self.time_left = save_data["time_left"]
-            self.move_history = save_data["move_history"]
-            self.captured_pieces = self._deserialize_captured_pieces(save_data["captured_pieces"])
-            self.move_count = save_data["move_count"]
+            filename = loaded["filename"]
+            save_data = loaded["save_data"]
+            
+            # Keep journaling into a loaded journal, a loaded snapshot starts a new one on save
+            self.close_journal()
+            self.state = loaded["state"]
+            if filename.endswith(JOURNAL_EXTENSION):
+                self.journal = self.game_saver.resume_journal(filename)
+                self.moves_since_checkpoint = 0
+            self.time_left = dict(save_data["time_left"])
             self.game_over = save_data["game_over"]
 
             # Reset selection and animation states
             self.selected_piece = None
             self.selected_square = None
             self.valid_moves = []
-            self.animating_piece = None
+            self.stop_animations()
             self.pending_move = None
             self.promotion_pending = False
+            self.input_queue.clear()
+            self.invalidate_analysis()
 
             logger.info("Game loaded successfully")
             return True
@@ -101,55 +287,9 @@ class Game:
             logger.error(f"Error loading game state: {str(e)}")
             return False
 
-    def _deserialize_board(self, board_state):
-        """Convert saved board state back to piece objects"""
-        piece_classes = {
-            "pawn": Pawn,
-            "rook": Rook,
-            "knight": Knight,
-            "bishop": Bishop,
-            "queen": Queen,
-            "king": King
-        }
-
-        board = [[None for _ in range(8)] for _ in range(8)]
-        for row in range(8):
-            for col in range(8):
-                piece_data = board_state[row][col]
-                if piece_data and isinstance(piece_data, dict):  # Check if it's a piece (dictionary)
-                    piece_class = piece_classes[piece_data['position']]
-                    piece = piece_class(piece_data['color'], piece_data['position'])
-                    if 'has_moved' in piece_data:
-                        piece.has_moved = piece_data['has_moved']
-                    board[row][col] = piece
-                else:
-                    board[row][col] = None  # Empty square
-
-        return board
-
-    def _deserialize_captured_pieces(self, captured_data):
-        """Convert saved captured pieces back to piece objects"""
-        piece_classes = {
-            "pawn": Pawn,
-            "rook": Rook,
-            "knight": Knight,
-            "bishop": Bishop,
-            "queen": Queen,
-            "king": King
-        }
-
-        captured = {"white": [], "black": []}
-        for color in ["white", "black"]:
-            for piece_data in captured_data[color]:
-                piece_class = piece_classes[piece_data['position']]
-                piece = piece_class(piece_data['color'], piece_data['position'])
-                captured[color].append(piece)
-
-        return captured
-
-    def get_saved_games(self):
-        """Get list of saved games"""
-        return self.game_saver.list_saved_games()
+    def get_saved_games(self, limit=None):
+        """Get list of saved games, newest first and at most limit of them"""
+        return self.game_saver.list_saved_games(limit=limit)
 
     def delete_saved_game(self, filename):
         """Delete a saved game"""
@@ -157,147 +297,250 @@ class Game:
 
     def get_square_notation(self, row, col):
         """Convert row and column to chess notation (e.g., 'e4')"""
-        files = 'abcdefgh'
-        ranks = '87654321'
-        return f"{files[col]}{ranks[row]}"
+        return get_square_notation(row, col)
+
+    def animate_piece_movement(self, start_pos, end_pos, piece_image):
+        """Start piece movement animation, fading out any piece it captures"""
+        now = pygame.time.get_ticks()
+        self.animating_piece = True
+        self.animation_piece_image = piece_image
+        self.move_tween = Tween(
+            (BOARD_OFFSET_X + start_pos[1] * SQUARE_SIZE, BOARD_OFFSET_Y + start_pos[0] * SQUARE_SIZE),
+            (BOARD_OFFSET_X + end_pos[1] * SQUARE_SIZE, BOARD_OFFSET_Y + end_pos[0] * SQUARE_SIZE),
+            ANIMATION_DURATION,
+            now,
+            on_complete=self.finish_move_animation
+        )
+        self.tweens.append(self.move_tween)
+        
+        captured = self.board[end_pos[0]][end_pos[1]]
+        if captured:
+            # A copy so the fade's alpha does not leak into the shared sprite
+            image = self.pieces_images[f"{captured.color}_{captured.position}"].copy()
+            tween = Tween(255, 0, ANIMATION_DURATION, now, easing=linear)
+            self.capture_fade = {"square": end_pos, "image": image, "tween": tween}
+            self.tweens.append(tween)
+
+    def update_animation(self, now=None):
+        """Advance every running tween to the current time.
 
-    def switch_turn(self):
-        """Switch the current turn between white and black"""
-        self.current_turn = "black" if self.current_turn == "white" else "white"
+        Returns True while any tween is running. Tweens that finish run their
+        completion callback, so the pending move is applied as soon as its
+        animation time is over however few frames were drawn.
+        """
+        if not self.tweens:
+            return False
+        
+        now = pygame.time.get_ticks() if now is None else now
+        for tween in list(self.tweens):
+            if tween.update(now):
+                self.tweens.remove(tween)
+                if tween.on_complete:
+                    tween.on_complete()
+        return True
+
+    def finish_move_animation(self):
+        """Apply the pending move once its piece has reached the target square"""
+        self.animating_piece = None
+        self.move_tween = None
+        self.capture_fade = None
+        if self.pending_move:
+            self.complete_move(self.pending_move, self.pending_move.get('promotion') or "queen")
+
+    def stop_animations(self):
+        """Drop every running tween without applying the pending move"""
+        self.tweens = []
+        self.animating_piece = None
+        self.move_tween = None
+        self.capture_fade = None
+
+    def get_hidden_squares(self):
+        """Get the board squares whose piece is drawn by an animation instead"""
+        hidden = set()
+        if self.animating_piece and self.selected_square:
+            hidden.add(self.selected_square)
+        if self.capture_fade:
+            hidden.add(self.capture_fade["square"])
+        return hidden
+
+    def process_input_queue(self):
+        """Replay clicks queued during an animation once the player can move again"""
+        while (self.input_queue and not self.animating_piece and not self.promotion_pending and
+               not self.game_over and self.current_turn != self.computer_color):
+            self.handle_click(self.input_queue.popleft())
+
+    def complete_move(self, pending_move, promotion="queen"):
+        """Apply a pending move to the game state, then log it and play its sound"""
+        source_square = pending_move['source_square']
+        target_square = pending_move['target_square']
+        
+        move = self.state.apply_move(pending_move['from'], pending_move['to'], promotion)
+        piece_type = move.piece.position.capitalize()
+        color = move.piece.color.capitalize()
+        captured_piece = move.captured_piece
+        
+        # Log the move
+        if move.is_capture:
+            logger.info(
+                f"{color} {piece_type} captures {captured_piece.color.capitalize()} "
+                f"{captured_piece.position.capitalize()} at {target_square} "
+                f"(moved from {source_square})"
+            )
+        else:
+            logger.info(
+                f"{color} {piece_type} moves from {source_square} to {target_square}"
+            )
+        self.invalidate_analysis()
+        
+        # Play appropriate sound
+        if move.is_capture:
+            self.capture_sound.play()
+        else:
+            self.move_sound.play()
+        
         logger.info(f"{self.current_turn.capitalize()}'s turn")
         
-        # Reset selection and valid moves
+        # Reset move and selection states
+        self.pending_move = None
         self.selected_piece = None
         self.selected_square = None
         self.valid_moves = []
-
-    def add_to_move_history(self, piece, source, target, is_capture=False, captured_piece=None):
-        """Add a move to the history"""
-        move_text = f"{self.move_count}. "
-        if piece.color == "white":
-            move_text += f"White {piece.position.capitalize()} {source}-{target}"
-            if is_capture:
-                move_text += f" x{captured_piece.position.capitalize()}"
-        else:
-            move_text += f"Black {piece.position.capitalize()} {source}-{target}"
-            if is_capture:
-                move_text += f" x{captured_piece.position.capitalize()}"
-            self.move_count += 1
         
-        self.move_history.append(move_text)
-        if len(self.move_history) > 10:  # Keep only last 10 moves
-            self.move_history.pop(0)
+        # Check for checkmate
+        self.update_game_state()
+        self.record_in_journal(move)
+        return move
 
-    def animate_piece_movement(self, start_pos, end_pos, piece_image):
-        """Start piece movement animation"""
-        self.animating_piece = True
-        self.animation_start = (
-            BOARD_OFFSET_X + start_pos[1] * SQUARE_SIZE,
-            BOARD_OFFSET_Y + start_pos[0] * SQUARE_SIZE
+    def play_computer_move(self):
+        """Search for the computer's move and start animating it"""
+        # Settle the clock first so time spent before the search is charged correctly
+        self.update_timer()
+        if self.game_over:
+            return False
+        
+        color = self.current_turn
+        time_budget = min(AI_MAX_THINK_TIME, self.time_left[color] / AI_TIME_DIVISOR)
+        search_start = pygame.time.get_ticks()
+        move = self.searcher.find_best_move(self.state, time_budget)
+        
+        # The search blocks the loop, so charge its time to the computer's clock here
+        self.last_tick = pygame.time.get_ticks()
+        self.time_left[color] -= (self.last_tick - search_start) / 1000
+        if self.time_left[color] <= 0:
+            self.time_left[color] = 0
+            self.game_over = True
+            winner = "Black" if color == "white" else "White"
+            logger.info(f"Game Over - {winner} wins by timeout")
+            self.refresh_journal_catalog()
+            return False
+        if move is None:
+            return False
+        
+        info = self.searcher.last_info
+        logger.info(
+            f"Computer searched to depth {info['depth']}: {info['nodes']} nodes in "
+            f"{info['seconds']:.2f}s ({info['nps']:.0f} nodes/s), "
+            f"TT hit rate {info['tt']['hit_rate']:.0%} ({info['tt']['filled']}/{info['tt']['capacity']} slots)"
         )
-        self.animation_end = (
-            BOARD_OFFSET_X + end_pos[1] * SQUARE_SIZE,
-            BOARD_OFFSET_Y + end_pos[0] * SQUARE_SIZE
+        
+        from_pos, to_pos, promotion = move
+        piece = self.board[from_pos[0]][from_pos[1]]
+        self.selected_piece = piece
+        self.selected_square = from_pos
+        self.animate_piece_movement(from_pos, to_pos, self.pieces_images[f"{piece.color}_{piece.position}"])
+        
+        # Store move data to be applied after animation
+        self.pending_move = {
+            'from': from_pos,
+            'to': to_pos,
+            'is_capture': self.board[to_pos[0]][to_pos[1]] is not None,
+            'captured_piece': self.board[to_pos[0]][to_pos[1]],
+            'source_square': self.get_square_notation(*from_pos),
+            'target_square': self.get_square_notation(*to_pos),
+            'promotion': promotion
+        }
+        return True
+
+    def undo_move(self):
+        """Take back the last move played in this session"""
+        if self.animating_piece or self.promotion_pending or not self.state.move_stack:
+            return False
+        
+        move = self.state.unmake_move()
+        # Against the computer, take back its reply too so the human is to move again
+        if self.current_turn == self.computer_color and self.state.move_stack:
+            move = self.state.unmake_move()
+        self.input_queue.clear()
+        logger.info(
+            f"Undid {move.piece.color.capitalize()} {move.piece.position.capitalize()} "
+            f"{self.get_square_notation(*move.from_pos)}-{self.get_square_notation(*move.to_pos)}"
         )
-        self.animation_progress = 0
-        self.animation_piece_image = piece_image
+        
+        # A finished game is reopened unless it was lost on time
+        if self.time_left["white"] > 0 and self.time_left["black"] > 0:
+            self.game_over = False
+        
+        # Replays cannot take moves back, so journal the position after the undo
+        if self.journal is not None:
+            self.write_journal_checkpoint()
+        
+        # Reset selection states
+        self.selected_piece = None
+        self.selected_square = None
+        self.valid_moves = []
+        self.invalidate_analysis()
+        return True
 
-    def update_animation(self):
-        """Update piece animation progress"""
-        if self.animating_piece:
-            self.animation_progress += ANIMATION_SPEED / 100
-            if self.animation_progress >= 1:
-                # Animation is complete, apply the pending move
-                if self.pending_move:
-                    from_pos = self.pending_move['from']
-                    to_pos = self.pending_move['to']
-                    is_capture = self.pending_move['is_capture']
-                    captured_piece = self.pending_move['captured_piece']
-                    source_square = self.pending_move['source_square']
-                    target_square = self.pending_move['target_square']
-                    
-                    # Log the move
-                    piece_type = self.board[from_pos[0]][from_pos[1]].position.capitalize()
-                    color = self.board[from_pos[0]][from_pos[1]].color.capitalize()
-                    
-                    if is_capture:
-                        # Add captured piece to the list
-                        self.captured_pieces[self.current_turn].append(captured_piece)
-                        logger.info(
-                            f"{color} {piece_type} captures {captured_piece.color.capitalize()} "
-                            f"{captured_piece.position.capitalize()} at {target_square} "
-                            f"(moved from {source_square})"
-                        )
-                    else:
-                        logger.info(
-                            f"{color} {piece_type} moves from {source_square} to {target_square}"
-                        )
-                    
-                    # Add move to history
-                    self.add_to_move_history(
-                        self.board[from_pos[0]][from_pos[1]],
-                        source_square,
-                        target_square,
-                        is_capture,
-                        captured_piece
-                    )
-                    
-                    # Move piece
-                    self.board[to_pos[0]][to_pos[1]] = self.board[from_pos[0]][from_pos[1]]
-                    self.board[from_pos[0]][from_pos[1]] = None
-                    
-                    # Update has_moved flag
-                    self.board[to_pos[0]][to_pos[1]].has_moved = True
-                    
-                    # Play appropriate sound
-                    if is_capture:
-                        self.capture_sound.play()
-                    else:
-                        self.move_sound.play()
-                    
-                    # Switch turns after a successful move
-                    self.switch_turn()
-                    
-                    # Check for checkmate
-                    self.update_game_state()
-                    
-                    # Reset animation and move states
-                    self.pending_move = None
-                    self.selected_piece = None
-                    self.selected_square = None
-                
-                self.animating_piece = None
-                self.animation_progress = 0
-            return True
-        return False
+    def get_animation_position(self):
+        """Get the screen position of the animated piece image, or None when idle"""
+        if not (self.animating_piece and self.animation_piece_image and self.move_tween):
+            return None
+        
+        # Current position along the eased path
+        current_x, current_y = self.move_tween.value
+        
+        x_offset = (SQUARE_SIZE - self.animation_piece_image.get_width()) // 2
+        y_offset = (SQUARE_SIZE - self.animation_piece_image.get_height()) // 2
+        return (int(current_x + x_offset), int(current_y + y_offset))
+
+    def get_capture_fade_alpha(self):
+        """Get the opacity of the captured piece fading out, or None"""
+        if not self.capture_fade:
+            return None
+        return int(self.capture_fade["tween"].value)
+
+    def draw_capture_fade(self):
+        """Draw the captured piece fading out on its square"""
+        alpha = self.get_capture_fade_alpha()
+        if alpha is None:
+            return
+        row, col = self.capture_fade["square"]
+        image = self.capture_fade["image"]
+        image.set_alpha(alpha)
+        self.screen.blit(image, (
+            BOARD_OFFSET_X + col * SQUARE_SIZE + (SQUARE_SIZE - image.get_width()) // 2,
+            BOARD_OFFSET_Y + row * SQUARE_SIZE + (SQUARE_SIZE - image.get_height()) // 2
+        ))
 
     def draw_animated_piece(self):
         """Draw the piece that is currently being animated"""
-        if self.animating_piece and self.animation_piece_image:
-            # Calculate current position using smooth easing
-            progress = 1 - (1 - self.animation_progress) ** 3  # Cubic easing
-            current_x = self.animation_start[0] + (self.animation_end[0] - self.animation_start[0]) * progress
-            current_y = self.animation_start[1] + (self.animation_end[1] - self.animation_start[1]) * progress
-            
-            # Draw the piece at the current position
-            x_offset = (SQUARE_SIZE - self.animation_piece_image.get_width()) // 2
-            y_offset = (SQUARE_SIZE - self.animation_piece_image.get_height()) // 2
-            self.screen.blit(
-                self.animation_piece_image,
-                (current_x + x_offset, current_y + y_offset)
-            )
+        position = self.get_animation_position()
+        if position:
+            self.screen.blit(self.animation_piece_image, position)
 
     def handle_click(self, pos):
         """Handle mouse click events"""
         # Handle promotion selection if pending
         if self.promotion_pending:
-            if self.handle_promotion(pos):
-                # Promotion was handled, switch turns
-                self.switch_turn()
+            self.handle_promotion(pos)
             return
             
-        # Don't handle clicks during animation
-        if self.animating_piece:
+        # Queue clicks during animation or while the computer is to move, they
+        # are replayed as premoves once the player is to move. Once the queue
+        # is full further clicks are ignored, so the queued premoves stay whole
+        if self.animating_piece or self.current_turn == self.computer_color:
+            if len(self.input_queue) < PREMOVE_QUEUE_SIZE:
+                self.input_queue.append(pos)
             return
             
         # Convert window coordinates to board coordinates
@@ -315,21 +558,12 @@ class Game:
         # If a piece is already selected
         if self.selected_piece:
             # Try to move the piece
+            # valid_moves come from the legal move table, so they never leave the king in check
             if (row, col) in self.valid_moves:
                 old_row, old_col = self.selected_square
                 
-                # Check if the move is legal (doesn't put own king in check)
-                if not self.simulate_move((old_row, old_col), (row, col)):
-                    logger.warning(
-                        f"Invalid move attempted to {square} - would put own king in check"
-                    )
-                    self.selected_piece = None
-                    self.selected_square = None
-                    self.valid_moves = []
-                    return
-                
                 # Check if this move will result in a pawn promotion
-                if self.needs_promotion(self.selected_piece, row):
+                if self.state.needs_promotion(self.selected_piece, row):
                     # Store promotion information
                     self.promotion_pending = True
                     self.promotion_square = (row, col)
@@ -345,11 +579,7 @@ class Game:
                         'target_square': square
                     }
                     
-                    # Move the pawn to the promotion square
-                    self.board[row][col] = self.board[old_row][old_col]
-                    self.board[old_row][old_col] = None
-                    
-                    # Clear selection but don't switch turns yet
+                    # Clear selection, the move is applied once a piece is chosen
                     self.selected_piece = None
                     self.selected_square = None
                     self.valid_moves = []
@@ -394,13 +624,8 @@ class Game:
             if piece and piece.color == self.current_turn:
                 self.selected_piece = piece
                 self.selected_square = (row, col)
-                # Get valid moves for the selected piece
-                self.valid_moves = piece.get_valid_moves(self.board, row, col)
-                # Filter out moves that would put own king in check
-                self.valid_moves = [
-                    move for move in self.valid_moves 
-                    if self.simulate_move((row, col), move)
-                ]
+                # Look up legal moves for the selected piece (pins and checks already applied)
+                self.valid_moves = self.get_legal_move_table().get((row, col), [])
                 # Log piece selection and valid moves
                 valid_squares = [self.get_square_notation(r, c) for r, c in self.valid_moves]
                 logger.info(
@@ -432,36 +657,28 @@ class Game:
         if is_current and not self.game_over:
             pygame.draw.rect(self.screen, LIGHT_GRAY, header_rect)
         
-        text = self.font_medium.render(color, True, text_color)
+        text = self.text_cache.render(self.font_medium, color, text_color)
         text_rect = text.get_rect(center=(x + SIDE_PANEL_WIDTH//2, 45))
         self.screen.blit(text, text_rect)
         
         # Draw timer
         self.draw_timer(side, x)
         
-        # Draw captured pieces with labels
+        # Draw captured pieces grouped by type, from the capture counters
         y = 130  # Moved down to make room for timer
-        piece_values = {"pawn": 1, "knight": 3, "bishop": 3, "rook": 5, "queen": 9, "king": 0}
-        total_value = 0
-        
-        for piece in self.captured_pieces[side]:
-            piece_key = f"{piece.color}_{piece.position}"
-            if piece_key in self.pieces_images:
-                # Calculate piece value
-                total_value += piece_values.get(piece.position, 0)
-                
-                # Draw piece
-                piece_img = pygame.transform.smoothscale(
-                    self.pieces_images[piece_key],
-                    (CAPTURED_PIECE_SIZE, CAPTURED_PIECE_SIZE)
-                )
-                self.screen.blit(piece_img, (x + 15, y))
+        captured_images = self.piece_atlas[CAPTURED_PIECE_SIZE]
+        opponent_color = "black" if side == "white" else "white"
+        for piece_type, count in self.state.capture_counts[side].items():
+            image = captured_images[f"{opponent_color}_{piece_type}"]
+            for _ in range(count):
+                self.screen.blit(image, (x + 15, y))
                 y += CAPTURED_PIECE_SIZE + 10
         
         # Draw material advantage
+        total_value = self.state.capture_points[side]
         if total_value > 0:
             advantage_text = f"+{total_value}"
-            text = self.font_medium.render(advantage_text, True, TEXT_COLOR)
+            text = self.text_cache.render(self.font_medium, advantage_text, TEXT_COLOR)
             self.screen.blit(text, (x + SIDE_PANEL_WIDTH - 50, 45))
 
     def draw_move_history(self):
@@ -477,7 +694,7 @@ class Game:
         title_bg = pygame.Rect(0, y, WINDOW_WIDTH, 40)
         pygame.draw.rect(self.screen, LIGHT_GRAY, title_bg)
         
-        text = self.font_medium.render("Move History", True, TEXT_COLOR)
+        text = self.text_cache.render(self.font_medium, "Move History", TEXT_COLOR)
         text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, y + 20))
         self.screen.blit(text, text_rect)
         
@@ -503,9 +720,9 @@ class Game:
             if i == len(self.move_history[-15:]) - 1:
                 last_move_rect = pygame.Rect(x - 5, y - 2, column_width - 10, 24)
                 pygame.draw.rect(self.screen, PRIMARY, last_move_rect)
-                text = self.font_small.render(move, True, WHITE)
+                text = self.text_cache.render(self.font_small, move, WHITE)
             else:
-                text = self.font_small.render(move, True, TEXT_COLOR)
+                text = self.text_cache.render(self.font_small, move, TEXT_COLOR)
             
             self.screen.blit(text, (x, y))
 
@@ -529,6 +746,7 @@ class Game:
                 self.game_over = True
                 winner = "Black" if self.current_turn == "white" else "White"
                 logger.info(f"Game Over - {winner} wins by timeout")
+                self.refresh_journal_catalog()
 
     def draw_timer(self, side, x):
         """Draw timer for a player"""
@@ -551,132 +769,121 @@ class Game:
         if self.current_turn == side:
             pygame.draw.rect(self.screen, LIGHT_GRAY, timer_rect)
         
-        text = self.font_medium.render(time_str, True, color)
+        text = self.text_cache.render(self.font_medium, time_str, color)
         text_rect = text.get_rect(center=(x + SIDE_PANEL_WIDTH//2, timer_y + timer_height//2))
         self.screen.blit(text, text_rect)
 
-    def get_threatened_pieces(self, attacking_color):
-        """Get all pieces that are under threat from the attacking color"""
-        threatened_pieces = []
-        defending_color = "black" if attacking_color == "white" else "white"
-        
-        # For each attacking piece
-        for row in range(8):
-            for col in range(8):
-                piece = self.board[row][col]
-                if piece and piece.color == attacking_color:
-                    # Get all possible moves for this piece
-                    moves = piece.get_valid_moves(self.board, row, col)
-                    
-                    # Check if any of these moves can capture an opponent's piece
-                    for move_row, move_col in moves:
-                        target_piece = self.board[move_row][move_col]
-                        if target_piece and target_piece.color == defending_color:
-                            # Simulate the move to check if it's legal (doesn't put own king in check)
-                            # Save current board state
-                            temp_piece = self.board[move_row][move_col]
-                            self.board[move_row][move_col] = self.board[row][col]
-                            self.board[row][col] = None
-                            
-                            # Check if the move is legal (doesn't put own king in check)
-                            if not self.is_king_in_check(attacking_color):
-                                threatened_pieces.append((move_row, move_col))
-                            
-                            # Restore board state
-                            self.board[row][col] = self.board[move_row][move_col]
-                            self.board[move_row][move_col] = temp_piece
-        
-        return threatened_pieces
-
-    def is_king_in_check(self, color):
-        """Check if the king of the given color is in check"""
-        # Find king position
-        king_pos = None
-        for row in range(8):
-            for col in range(8):
-                piece = self.board[row][col]
-                if piece and piece.position == "king" and piece.color == color:
-                    king_pos = (row, col)
-                    break
-            if king_pos:
-                break
-        
-        if not king_pos:
-            return False
-        
-        # Check if any opponent piece can attack the king
-        opponent_color = "black" if color == "white" else "white"
-        for row in range(8):
-            for col in range(8):
-                piece = self.board[row][col]
-                if piece and piece.color == opponent_color:
-                    moves = piece.get_valid_moves(self.board, row, col)
-                    if king_pos in moves:
-                        return True
-        return False
+    def get_position_analysis(self):
+        """Get threatened squares, check state, king square and legal moves for the current position.
 
-    def simulate_move(self, from_pos, to_pos):
-        """Simulate a move and return if it's legal"""
-        # Save current board state
-        temp_piece = self.board[to_pos[0]][to_pos[1]]
-        # Make move
-        self.board[to_pos[0]][to_pos[1]] = self.board[from_pos[0]][from_pos[1]]
-        self.board[from_pos[0]][from_pos[1]] = None
-        
-        # Check if king is in check after move
-        color = self.board[to_pos[0]][to_pos[1]].color
-        is_legal = not self.is_king_in_check(color)
-        
-        # Restore board state
-        self.board[from_pos[0]][from_pos[1]] = self.board[to_pos[0]][to_pos[1]]
-        self.board[to_pos[0]][to_pos[1]] = temp_piece
-        
-        return is_legal
+        The analysis is computed once per position and served from the cache on
+        every following frame until a move, promotion or load changes the board.
+        Positions seen before (after an undo, or a repeated position) come from
+        the analysis table instead of being recomputed.
+        """
+        key = self.state.position_key()
+        if self._analysis is None or self._analysis_key != key:
+            packed = self.analysis_table.get_value(key)
+            if packed is not None:
+                analysis = self._unpack_analysis(packed)
+            else:
+                opponent_color = "black" if self.current_turn == "white" else "white"
+                legal_moves = self.state.get_legal_moves(self.current_turn)
+                in_check = self.state.is_king_in_check(self.current_turn)
+                analysis = {
+                    "threatened": self.state.get_threatened_pieces(opponent_color),
+                    "in_check": in_check,
+                    "king_square": self.state.find_king(self.current_turn),
+                    "legal_moves": legal_moves,
+                    "checkmate": in_check and not any(legal_moves.values()),
+                    "stalemate": not in_check and not any(legal_moves.values())
+                }
+                self.analysis_table.put_value(key, self._pack_analysis(analysis))
+            self._analysis = analysis
+            self._analysis_key = key
+        return self._analysis
 
-    def is_checkmate(self, color):
-        """Check if the given color is in checkmate"""
-        # If king is not in check, it's not checkmate
-        if not self.is_king_in_check(color):
-            return False
-        
-        # Try all possible moves for all pieces
-        for row in range(8):
-            for col in range(8):
-                piece = self.board[row][col]
-                if piece and piece.color == color:
-                    # Get all possible moves for this piece
-                    moves = piece.get_valid_moves(self.board, row, col)
-                    
-                    # Try each move
-                    for move_row, move_col in moves:
-                        # If any move gets out of check, it's not checkmate
-                        if self.simulate_move((row, col), (move_row, move_col)):
-                            return False
-        
-        # If no legal moves found, it's checkmate
-        return True
+    def _pack_analysis(self, analysis):
+        """Store an analysis as square bitmasks so every table entry has a bounded size"""
+        threatened = 0
+        for square in analysis["threatened"]:
+            threatened |= 1 << square_index(*square)
+        legal_moves = []
+        for square, targets in analysis["legal_moves"].items():
+            mask = 0
+            for target in targets:
+                mask |= 1 << square_index(*target)
+            legal_moves.append((square_index(*square), mask))
+        king_square = analysis["king_square"]
+        return (
+            threatened,
+            analysis["in_check"],
+            square_index(*king_square) if king_square else None,
+            tuple(legal_moves)
+        )
+
+    def _unpack_analysis(self, packed):
+        """Rebuild the analysis dict from a _pack_analysis value"""
+        threatened, in_check, king_square, legal_masks = packed
+        has_moves = any(mask for _, mask in legal_masks)
+        return {
+            "threatened": [square_coords(square) for square in iter_bits(threatened)],
+            "in_check": in_check,
+            "king_square": square_coords(king_square) if king_square is not None else None,
+            "legal_moves": {
+                square_coords(square): [square_coords(target) for target in iter_bits(mask)]
+                for square, mask in legal_masks
+            },
+            "checkmate": in_check and not has_moves,
+            "stalemate": not in_check and not has_moves
+        }
+
+    def get_legal_move_table(self):
+        """Get the from-square to legal-targets table for the side to move"""
+        return self.get_position_analysis()["legal_moves"]
+
+    def invalidate_analysis(self):
+        """Drop the cached position analysis after the board changes"""
+        self._analysis_key = None
+        self._analysis = None
 
     def update_game_state(self):
-        """Update game state including check and checkmate conditions"""
-        if self.is_king_in_check(self.current_turn):
+        """Update game state including check, checkmate and draw conditions.
+
+        Runs as the turn starts, and builds the legal move table for the side
+        to move that clicks, checkmate and stalemate detection then read from.
+        """
+        analysis = self.get_position_analysis()
+        if analysis["in_check"]:
             logger.info(f"{self.current_turn.capitalize()} is in check!")
             
-            if self.is_checkmate(self.current_turn):
-                self.game_over = True
-                winner = "Black" if self.current_turn == "white" else "White"
-                logger.info(f"Checkmate! {winner} wins!")
-                return True
-        return False
+        outcome = self.get_outcome()
+        if outcome is None:
+            return False
+        
+        self.game_over = True
+        if outcome["winner"]:
+            logger.info(f"Checkmate! {outcome['winner'].capitalize()} wins!")
+        else:
+            logger.info(f"Draw by {DRAW_REASONS[outcome['result']]}")
+        return True
+
+    def get_outcome(self):
+        """Get the checkmate or draw that ends the game in the current position, or None.
+
+        Mate and stalemate come from the cached legal move table. Repetition
+        and the fifty-move rule depend on the moves that led here rather than
+        the position alone, so they are checked on every call.
+        """
+        return self.state.outcome(self.get_legal_move_table())
 
     def draw_game_over_screen(self):
         """Draw game over screen with statistics"""
         if not self.game_over:
             return
             
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))  # Semi-transparent black
-        self.screen.blit(overlay, (0, 0))
+        # Draw semi-transparent overlay
+        self.screen.blit(self.overlays["dim"], (0, 0))
         
         # Create game over panel
         panel_width = 600
@@ -696,20 +903,26 @@ class Game:
         elif self.time_left["black"] <= 0:
             winner = "White"
             reason = "by timeout"
-        elif self.is_checkmate(self.current_turn):
-            winner = "Black" if self.current_turn == "white" else "White"
-            reason = "by checkmate"
         else:
-            winner = "Unknown"
-            reason = ""
+            outcome = self.get_outcome()
+            if outcome and outcome["winner"]:
+                winner = outcome["winner"].capitalize()
+                reason = "by checkmate"
+            elif outcome:
+                winner = None
+                reason = DRAW_REASONS[outcome["result"]]
+            else:
+                winner = "Unknown"
+                reason = ""
         
         # Draw game over text
-        game_over_text = self.font_large.render("Game Over", True, TEXT_COLOR)
+        game_over_text = self.text_cache.render(self.font_large, "Game Over", TEXT_COLOR)
         text_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 50))
         self.screen.blit(game_over_text, text_rect)
         
         # Draw winner text with reason
-        winner_text = self.font_large.render(f"{winner} Wins {reason}!", True, WINNER_COLOR)
+        result_text = f"{winner} Wins {reason}!" if winner else f"Draw by {reason}!"
+        winner_text = self.text_cache.render(self.font_large, result_text, WINNER_COLOR)
         text_rect = winner_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 120))
         self.screen.blit(winner_text, text_rect)
         
@@ -720,7 +933,7 @@ class Game:
         # Time statistics
         for color in ["White", "Black"]:
             time_str = self.format_time(int(self.time_left[color.lower()]))
-            text = self.font_medium.render(f"{color}'s Time Left: {time_str}", True, TEXT_COLOR)
+            text = self.text_cache.render(self.font_medium, f"{color}'s Time Left: {time_str}", TEXT_COLOR)
             text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, y))
             self.screen.blit(text, text_rect)
             y += spacing
@@ -728,29 +941,158 @@ class Game:
         # Captured pieces statistics
         for color in ["White", "Black"]:
             captured = len(self.captured_pieces[color.lower()])
-            text = self.font_medium.render(f"{color}'s Captured Pieces: {captured}", True, TEXT_COLOR)
+            text = self.text_cache.render(self.font_medium, f"{color}'s Captured Pieces: {captured}", TEXT_COLOR)
             text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, y))
             self.screen.blit(text, text_rect)
             y += spacing
         
         # Total moves
         total_moves = len(self.move_history)
-        text = self.font_medium.render(f"Total Moves: {total_moves}", True, TEXT_COLOR)
+        text = self.text_cache.render(self.font_medium, f"Total Moves: {total_moves}", TEXT_COLOR)
         text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, y))
         self.screen.blit(text, text_rect)
         
         # Draw "Press any key to exit" text
-        text = self.font_small.render("Press any key to exit", True, SECONDARY)
+        text = self.text_cache.render(self.font_small, "Press any key to exit", SECONDARY)
         text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + panel_height - 40))
         self.screen.blit(text, text_rect)
 
+    def get_screen_regions(self):
+        """Map every independently redrawn screen region to its (rect, signature).
+
+        The signature holds everything that affects how the region looks, so a
+        region only needs to be redrawn when its signature or rect changes.
+        """
+        regions = {}
+        
+        # Board squares: piece, threat, check, selection and move dot overlays
+        analysis = self.get_position_analysis()
+        threatened = set(analysis["threatened"])
+        check_square = analysis["king_square"] if analysis["in_check"] else None
+        valid_moves = set(self.valid_moves)
+        hidden_squares = self.get_hidden_squares()
+        for row in range(8):
+            for col in range(8):
+                square = (row, col)
+                piece = self.board[row][col]
+                piece_key = f"{piece.color}_{piece.position}" if piece and square not in hidden_squares else None
+                rect = pygame.Rect(
+                    BOARD_OFFSET_X + col * SQUARE_SIZE,
+                    BOARD_OFFSET_Y + row * SQUARE_SIZE,
+                    SQUARE_SIZE, SQUARE_SIZE
+                )
+                regions[square] = (rect, (
+                    piece_key,
+                    square in threatened,
+                    square == check_square,
+                    square == self.selected_square,
+                    square in valid_moves
+                ))
+        
+        # The piece in flight, padded to cover rounding of its position
+        position = self.get_animation_position()
+        if position:
+            rect = self.animation_piece_image.get_rect(topleft=position).inflate(4, 4)
+            regions["animation"] = (rect, position)
+        
+        alpha = self.get_capture_fade_alpha()
+        if alpha is not None:
+            row, col = self.capture_fade["square"]
+            rect = pygame.Rect(
+                BOARD_OFFSET_X + col * SQUARE_SIZE,
+                BOARD_OFFSET_Y + row * SQUARE_SIZE,
+                SQUARE_SIZE, SQUARE_SIZE
+            )
+            regions["capture_fade"] = (rect, alpha)
+        
+        # Side panels, with the ticking timers as separate smaller regions
+        for side, x in (("black", 0), ("white", WINDOW_WIDTH - SIDE_PANEL_WIDTH)):
+            is_current = self.current_turn == side
+            captured = tuple(self.state.capture_counts[side].values())
+            regions[f"{side}_panel"] = (
+                pygame.Rect(x, 0, SIDE_PANEL_WIDTH, WINDOW_HEIGHT),
+                (is_current, self.game_over, captured)
+            )
+            regions[f"{side}_timer"] = (
+                pygame.Rect(x + 10, 70, SIDE_PANEL_WIDTH - 20, 40),
+                (is_current, int(self.time_left[side]))
+            )
+        
+        turn_text = f"{self.current_turn.capitalize()}'s Turn"
+        regions["turn"] = (self._text_rect(self.font_large, turn_text, (WINDOW_WIDTH // 2, 30)), turn_text)
+        
+        regions["history"] = (
+            pygame.Rect(0, WINDOW_HEIGHT - HISTORY_PANEL_HEIGHT, WINDOW_WIDTH, HISTORY_PANEL_HEIGHT),
+            tuple(self.move_history[-15:])
+        )
+        
+        # Full-window overlays and the promotion choice under the mouse. The game
+        # over panel also lists the clocks, so it depends on them
+        overlay_clocks = tuple(int(self.time_left[side]) for side in ("white", "black")) if self.game_over else None
+        regions["overlay"] = (self.screen.get_rect(), (self.game_over, self.promotion_pending, overlay_clocks))
+        if self.promotion_pending:
+            regions["promotion"] = (
+                pygame.Rect(
+                    (WINDOW_WIDTH - PROMOTION_PANEL_WIDTH) // 2,
+                    (WINDOW_HEIGHT - PROMOTION_PANEL_HEIGHT) // 2,
+                    PROMOTION_PANEL_WIDTH, PROMOTION_PANEL_HEIGHT
+                ),
+                self.get_promotion_hover_index()
+            )
+        
+        message = self._active_message()
+        if message:
+            regions["message"] = (self._text_rect(self.font_large, message, (WINDOW_WIDTH // 2, 80)), message)
+        return regions
+
+    def get_dirty_rects(self):
+        """Get the screen rects that changed since the last drawn frame"""
+        regions = self.get_screen_regions()
+        previous = self._drawn_regions
+        self._drawn_regions = regions
+        
+        screen_rect = self.screen.get_rect()
+        if self._full_redraw or previous is None:
+            self._full_redraw = False
+            return [screen_rect]
+        
+        dirty_rects = []
+        for name in regions.keys() | previous.keys():
+            old_rect, old_signature = previous.get(name, (None, None))
+            rect, signature = regions.get(name, (None, None))
+            if old_rect != rect or old_signature != signature:
+                # Clear where the region was and draw where it is now
+                dirty_rects.extend(r for r in (old_rect, rect) if r)
+        
+        if screen_rect in dirty_rects:
+            return [screen_rect]
+        return dirty_rects
+
+    def request_full_redraw(self):
+        """Redraw the whole window on the next frame, e.g. after another screen drew over it"""
+        self._full_redraw = True
+
     def draw(self):
-        """Draw the game state"""
-        self.screen.fill(WHITE)
+        """Redraw only the screen regions that changed and push them to the display"""
+        dirty_rects = self.get_dirty_rects()
+        if not dirty_rects:
+            return False
         
-        # Draw side panels
-        self.draw_side_panel("black", 0)
-        self.draw_side_panel("white", WINDOW_WIDTH - SIDE_PANEL_WIDTH)
+        self.screen.set_clip(dirty_rects[0].unionall(dirty_rects[1:]))
+        self.draw_scene()
+        self.screen.set_clip(None)
+        pygame.display.update(dirty_rects)
+        return True
+
+    def build_board_layer(self):
+        """Render the parts of the screen that never change during a game.
+
+        The layer holds the background, the board frame, the squares and the
+        coordinate labels. It is rebuilt only when the window size changes or
+        invalidate_board_layer is called after a theme change.
+        """
+        layer = pygame.Surface(self.screen.get_size())
+        layer.fill(WHITE)
         
         # Draw board with shadow effect
         board_rect = pygame.Rect(
@@ -759,14 +1101,14 @@ class Game:
             BOARD_SIZE + 4,
             BOARD_SIZE + 4
         )
-        pygame.draw.rect(self.screen, PANEL_BORDER, board_rect)
+        pygame.draw.rect(layer, PANEL_BORDER, board_rect)
         
         # Draw squares
         for row in range(8):
             for col in range(8):
                 color = LIGHT_SQUARE if (row + col) % 2 == 0 else DARK_SQUARE
                 pygame.draw.rect(
-                    self.screen,
+                    layer,
                     color,
                     (BOARD_OFFSET_X + col * SQUARE_SIZE,
                      BOARD_OFFSET_Y + row * SQUARE_SIZE,
@@ -780,71 +1122,98 @@ class Game:
         # Draw file labels (a-h)
         for i in range(8):
             # Bottom labels
-            text = self.font_small.render(files[i], True, SECONDARY)
+            text = self.text_cache.render(self.font_small, files[i], SECONDARY)
             text_rect = text.get_rect(center=(
                 BOARD_OFFSET_X + i * SQUARE_SIZE + SQUARE_SIZE//2,
                 BOARD_OFFSET_Y + BOARD_SIZE + 25
             ))
-            self.screen.blit(text, text_rect)
+            layer.blit(text, text_rect)
             
             # Top labels
-            text = self.font_small.render(files[i], True, SECONDARY)
+            text = self.text_cache.render(self.font_small, files[i], SECONDARY)
             text_rect = text.get_rect(center=(
                 BOARD_OFFSET_X + i * SQUARE_SIZE + SQUARE_SIZE//2,
                 BOARD_OFFSET_Y - 25
             ))
-            self.screen.blit(text, text_rect)
+            layer.blit(text, text_rect)
         
         # Draw rank labels (1-8)
         for i in range(8):
             # Left side labels
-            text = self.font_small.render(ranks[i], True, SECONDARY)
+            text = self.text_cache.render(self.font_small, ranks[i], SECONDARY)
             text_rect = text.get_rect(center=(
                 BOARD_OFFSET_X - 25,
                 BOARD_OFFSET_Y + i * SQUARE_SIZE + SQUARE_SIZE//2
             ))
-            self.screen.blit(text, text_rect)
+            layer.blit(text, text_rect)
             
             # Right side labels
-            text = self.font_small.render(ranks[i], True, SECONDARY)
+            text = self.text_cache.render(self.font_small, ranks[i], SECONDARY)
             text_rect = text.get_rect(center=(
                 BOARD_OFFSET_X + BOARD_SIZE + 25,
                 BOARD_OFFSET_Y + i * SQUARE_SIZE + SQUARE_SIZE//2
             ))
-            self.screen.blit(text, text_rect)
+            layer.blit(text, text_rect)
+        return layer
+
+    def build_overlays(self):
+        """Create the semi-transparent overlay surfaces once so frames can reuse them"""
+        def square_overlay(color):
+            surface = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
+            surface.fill(color)
+            return surface
+        
+        move_dot = pygame.Surface((36, 36), pygame.SRCALPHA)
+        pygame.draw.circle(move_dot, POSSIBLE_MOVE_ALPHA, (18, 18), 12)
+        
+        dim = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        dim.fill((0, 0, 0, 128))  # Semi-transparent black
+        
+        return {
+            "threat": square_overlay(THREATENED_SQUARE),
+            "check": square_overlay(KING_DANGER),
+            "highlight": square_overlay((*HIGHLIGHT, 180)),
+            "move_dot": move_dot,
+            "dim": dim
+        }
+
+    def invalidate_board_layer(self):
+        """Rebuild the static board layer on the next frame"""
+        self.board_layer = None
+        self.request_full_redraw()
+
+    def draw_scene(self):
+        """Draw the whole game state onto the screen surface"""
+        # Draw the background, board frame, squares and coordinates in one blit
+        if self.board_layer is None or self.board_layer.get_size() != self.screen.get_size():
+            self.board_layer = self.build_board_layer()
+        self.screen.blit(self.board_layer, (0, 0))
+        
+        # Draw side panels
+        self.draw_side_panel("black", 0)
+        self.draw_side_panel("white", WINDOW_WIDTH - SIDE_PANEL_WIDTH)
         
         # Draw threatened pieces
-        opponent_color = "black" if self.current_turn == "white" else "white"
-        threatened_pieces = self.get_threatened_pieces(opponent_color)
+        analysis = self.get_position_analysis()
         
-        for row, col in threatened_pieces:
-            s = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
-            pygame.draw.rect(s, THREATENED_SQUARE, s.get_rect())
-            self.screen.blit(s, (
+        for row, col in analysis["threatened"]:
+            self.screen.blit(self.overlays["threat"], (
                 BOARD_OFFSET_X + col * SQUARE_SIZE,
                 BOARD_OFFSET_Y + row * SQUARE_SIZE
             ))
         
         # Highlight king in check
-        if self.is_king_in_check(self.current_turn):
-            # Find king position
-            for row in range(8):
-                for col in range(8):
-                    piece = self.board[row][col]
-                    if piece and piece.position == "king" and piece.color == self.current_turn:
-                        s = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
-                        pygame.draw.rect(s, KING_DANGER, s.get_rect())
-                        self.screen.blit(s, (
-                            BOARD_OFFSET_X + col * SQUARE_SIZE,
-                            BOARD_OFFSET_Y + row * SQUARE_SIZE
-                        ))
+        if analysis["in_check"] and analysis["king_square"]:
+            row, col = analysis["king_square"]
+            self.screen.blit(self.overlays["check"], (
+                BOARD_OFFSET_X + col * SQUARE_SIZE,
+                BOARD_OFFSET_Y + row * SQUARE_SIZE
+            ))
         
         # Highlight selected square with semi-transparent overlay
         if self.selected_square:
             row, col = self.selected_square
-            s = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
-            pygame.draw.rect(s, (*HIGHLIGHT, 180), s.get_rect())  # Semi-transparent
-            self.screen.blit(s, (
+            self.screen.blit(self.overlays["highlight"], (
                 BOARD_OFFSET_X + col * SQUARE_SIZE,
                 BOARD_OFFSET_Y + row * SQUARE_SIZE
             ))
@@ -859,19 +1228,18 @@ class Game:
             pygame.draw.circle(self.screen, POSSIBLE_MOVE, center, 18)
             
             # Draw inner circle with semi-transparent surface
-            s = pygame.Surface((36, 36), pygame.SRCALPHA)
-            pygame.draw.circle(s, POSSIBLE_MOVE_ALPHA, (18, 18), 12)
-            self.screen.blit(s, (center[0] - 18, center[1] - 18))
+            self.screen.blit(self.overlays["move_dot"], (center[0] - 18, center[1] - 18))
         
         # Draw pieces with shadows
-        for row in range(8):
-            for col in range(8):
+        hidden_squares = self.get_hidden_squares()
+        for pieces in self.state.piece_lists.values():
+            for row, col in pieces:
                 piece = self.board[row][col]
                 if piece:
                     piece_key = f"{piece.color.lower()}_{piece.position}"
                     if piece_key in self.pieces_images:
                         # Skip drawing if this piece is being animated
-                        if self.animating_piece and (row, col) == self.selected_square:
+                        if (row, col) in hidden_squares:
                             continue
                         
                         piece_image = self.pieces_images[piece_key]
@@ -883,12 +1251,13 @@ class Game:
                              BOARD_OFFSET_Y + row * SQUARE_SIZE + y_offset)
                         )
         
-        # Draw the animated piece on top
+        # Draw the captured piece fading out, then the moving piece on top
+        self.draw_capture_fade()
         self.draw_animated_piece()
         
         # Draw turn indicator with modern style
         turn_text = f"{self.current_turn.capitalize()}'s Turn"
-        text_surface = self.font_large.render(turn_text, True, ACTIVE_COLOR)
+        text_surface = self.text_cache.render(self.font_large, turn_text, ACTIVE_COLOR)
         text_rect = text_surface.get_rect(center=(WINDOW_WIDTH // 2, 30))
         self.screen.blit(text_surface, text_rect)
         
@@ -904,48 +1273,80 @@ class Game:
             self.draw_promotion_panel()
         
         # Draw temporary message if exists
-        if hasattr(self, 'message') and hasattr(self, 'message_start_time'):
-            current_time = pygame.time.get_ticks()
-            if current_time - self.message_start_time < self.message_duration:
-                text = self.font_large.render(self.message, True, PRIMARY)
-                text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, 80))
-                self.screen.blit(text, text_rect)
-            else:
-                delattr(self, 'message')
-                delattr(self, 'message_start_time')
+        message = self._active_message()
+        if message:
+            text = self.text_cache.render(self.font_large, message, PRIMARY)
+            text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, 80))
+            self.screen.blit(text, text_rect)
+
+    def is_computer_to_move(self):
+        """Check if the computer should search for its move now"""
+        return (self.current_turn == self.computer_color and not self.game_over and
+                not self.animating_piece and not self.promotion_pending)
 
-        pygame.display.flip()
+    def get_idle_timeout(self):
+        """Get how many milliseconds the loop may sleep waiting for input.
+
+        Returns 0 while a piece is animating or the computer is to move, since
+        those need a frame right away. Otherwise the loop sleeps until the
+        running clock shows a new second or the message expires, waking up
+        sooner while the save worker has results to report.
+        """
+        if self.animating_piece or self.is_computer_to_move():
+            return 0
+        
+        timeout = IDLE_MAX_WAIT
+        if not self.game_over:
+            time_left = self.time_left[self.current_turn]
+            timeout = min(timeout, int((time_left - int(time_left)) * 1000) + 1)
+        if self._active_message():
+            remaining = self.message_start_time + self.message_duration - pygame.time.get_ticks()
+            timeout = min(timeout, remaining + 1)
+        if self.save_worker.busy():
+            timeout = min(timeout, SAVE_POLL_INTERVAL)  # Wake up to report the save or load
+        return max(timeout, 1)
 
     def run(self):
         """Main game loop"""
         running = True
+        self.request_full_redraw()  # The menu drew over the window
         while running:
-            for event in pygame.event.get():
+            # Finished saves and loads take effect at the frame boundary
+            self.save_worker.poll()
+            
+            events = pygame.event.get()
+            idle_timeout = self.get_idle_timeout()
+            if not events and idle_timeout:
+                # Nothing on screen can change before the timeout, so sleep until input
+                event = pygame.event.wait(idle_timeout)
+                if event.type != pygame.NOEVENT:
+                    events = [event] + pygame.event.get()
+            
+            for event in events:
                 if event.type == pygame.QUIT:
                     logger.info("Game ended")
                     running = False
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self.request_full_redraw()
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         # Return to menu when ESC is pressed
                         logger.info("Returning to main menu")
+                        if self.journal is not None:
+                            self.submit_journal_write(self.journal.sync)
                         return "menu"
                     elif event.key == pygame.K_s and pygame.key.get_mods() & pygame.KMOD_CTRL:
-                        # Ctrl+S to save game
-                        if self.save_current_game():
-                            self._show_message("Game saved successfully!", 2)
+                        # Ctrl+S to save game in the background
+                        self.save_current_game()
+                    elif event.key == pygame.K_z and pygame.key.get_mods() & pygame.KMOD_CTRL:
+                        # Ctrl+Z to take back the last move
+                        if self.undo_move():
+                            self._show_message("Move undone", 1)
                         else:
-                            self._show_message("Failed to save game!", 2)
+                            self._show_message("Nothing to undo!", 1)
                     elif event.key == pygame.K_l and pygame.key.get_mods() & pygame.KMOD_CTRL:
-                        # Ctrl+L to load game
-                        saved_games = self.get_saved_games()
-                        if saved_games:
-                            # Load the most recent save
-                            if self.load_saved_game(saved_games[0]['filename']):
-                                self._show_message("Game loaded successfully!", 2)
-                            else:
-                                self._show_message("Failed to load game!", 2)
-                        else:
-                            self._show_message("No saved games found!", 2)
+                        # Ctrl+L to load the most recent save in the background
+                        self.request_load()
                 elif event.type == pygame.MOUSEBUTTONDOWN and not self.game_over:
                     if event.button == 1:  # Left click
                         self.handle_click(event.pos)
@@ -958,19 +1359,22 @@ class Game:
                 # Update timer
                 self.update_timer()
             
+            # Play clicks queued during the last animation as premoves
+            self.process_input_queue()
+            
             # Draw game state
             self.draw()
-            self.clock.tick(ANIMATION_FPS)
+            
+            # Let the computer think once the previous move is on screen
+            if self.is_computer_to_move():
+                self.play_computer_move()
+            
+            self.clock.tick(GAME_IDLE_FPS if idle_timeout else GAME_ACTIVE_FPS)
         
+        self.close()
         pygame.quit()
         return "quit"
 
-    def needs_promotion(self, piece, row):
-        """Check if a pawn needs promotion"""
-        return (piece.position == "pawn" and 
-                ((piece.color == "white" and row == 0) or 
-                 (piece.color == "black" and row == 7)))
-
     def handle_promotion(self, pos):
         """Handle click events during pawn promotion"""
         if not self.promotion_pending:
@@ -994,17 +1398,6 @@ class Game:
             chosen_piece = self.promotion_pieces[piece_index]
             row, col = self.promotion_square
             
-            # Create the new piece
-            piece_classes = {
-                "queen": Queen,
-                "rook": Rook,
-                "bishop": Bishop,
-                "knight": Knight
-            }
-            
-            # Replace the pawn with the chosen piece
-            self.board[row][col] = piece_classes[chosen_piece](self.promotion_color, chosen_piece)
-            
             # Log the promotion
             logger.info(
                 f"Pawn promoted to {chosen_piece.capitalize()} at "
@@ -1016,19 +1409,30 @@ class Game:
             self.promotion_square = None
             self.promotion_color = None
             
+            # Play the pawn move with the chosen piece replacing the pawn
+            self.complete_move(self.pending_move, chosen_piece)
+            
             return True
         
         return False
 
+    def get_promotion_hover_index(self):
+        """Get the index of the promotion choice under the mouse, or None"""
+        panel_x = (WINDOW_WIDTH - PROMOTION_PANEL_WIDTH) // 2
+        panel_y = (WINDOW_HEIGHT - PROMOTION_PANEL_HEIGHT) // 2
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        if not (panel_x <= mouse_x < panel_x + PROMOTION_PANEL_WIDTH and
+                panel_y <= mouse_y < panel_y + PROMOTION_PANEL_HEIGHT):
+            return None
+        return (mouse_x - panel_x) // (PROMOTION_PANEL_WIDTH // len(self.promotion_pieces))
+
     def draw_promotion_panel(self):
         """Draw the pawn promotion selection panel"""
         if not self.promotion_pending:
             return
             
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.screen.blit(overlay, (0, 0))
+        # Draw semi-transparent overlay
+        self.screen.blit(self.overlays["dim"], (0, 0))
         
         # Draw promotion panel
         panel_x = (WINDOW_WIDTH - PROMOTION_PANEL_WIDTH) // 2
@@ -1044,6 +1448,7 @@ class Game:
         
         # Get mouse position for hover effect
         mouse_pos = pygame.mouse.get_pos()
+        promotion_images = self.piece_atlas[PROMOTION_PIECE_SIZE]
         
         for i, piece_type in enumerate(self.promotion_pieces):
             piece_x = panel_x + (i * piece_width)
@@ -1055,11 +1460,8 @@ class Game:
             
             # Draw piece
             piece_key = f"{self.promotion_color}_{piece_type}"
-            if piece_key in self.pieces_images:
-                piece_image = pygame.transform.smoothscale(
-                    self.pieces_images[piece_key],
-                    (PROMOTION_PIECE_SIZE, PROMOTION_PIECE_SIZE)
-                )
+            if piece_key in promotion_images:
+                piece_image = promotion_images[piece_key]
                 
                 # Center the piece in its section
                 image_x = piece_x + (piece_width - PROMOTION_PIECE_SIZE) // 2
@@ -1068,10 +1470,26 @@ class Game:
                 self.screen.blit(piece_image, (image_x, image_y))
                 
                 # Draw piece name
-                text = self.font_small.render(piece_type.capitalize(), True, TEXT_COLOR)
+                text = self.text_cache.render(self.font_small, piece_type.capitalize(), TEXT_COLOR)
                 text_rect = text.get_rect(center=(piece_x + piece_width//2, panel_y + PROMOTION_PANEL_HEIGHT - 20))
                 self.screen.blit(text, text_rect)
 
+    def _text_rect(self, font, text, center):
+        """Get the rect a line of text will cover when drawn centered on a point"""
+        rect = pygame.Rect((0, 0), font.size(text))
+        rect.center = center
+        return rect
+
+    def _active_message(self):
+        """Get the temporary message to show, dropping it once it has expired"""
+        if not (hasattr(self, 'message') and hasattr(self, 'message_start_time')):
+            return None
+        if pygame.time.get_ticks() - self.message_start_time < self.message_duration:
+            return self.message
+        delattr(self, 'message')
+        delattr(self, 'message_start_time')
+        return None
+
     def _show_message(self, message, duration):
         """Show a temporary message on screen"""
         self.message = message
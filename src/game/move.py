@@ -0,0 +1,26 @@
+class Move:
+    """A move that can be played on a GameState and taken back exactly"""
+
+    def __init__(self, from_pos, to_pos, promotion=None):
+        self.from_pos = from_pos
+        self.to_pos = to_pos
+        self.promotion = promotion  # Piece type a pawn turns into on the last rank
+
+        # Filled in by GameState.make_move so unmake_move can restore the position
+        self.piece = None
+        self.captured_piece = None
+        self.moved_mask = 0  # Moved mask of the position before the move
+        self.halfmove_clock = 0  # Halfmove clock before the move
+
+        # Filled in by GameState.apply_move when the move is written to the history
+        self.history_entry = None
+        self.dropped_history = None
+        self.move_count = None
+
+    @property
+    def is_capture(self):
+        """Whether the move took an enemy piece"""
+        return self.captured_piece is not None
+
+    def __repr__(self):
+        return f"Move({self.from_pos}, {self.to_pos}, {self.promotion!r})"
@@ -0,0 +1,447 @@
+from config.settings import MOVE_GENERATOR
+from src.board.attacks import is_square_attacked, locate_king
+from src.board.bitboard import Bitboards, square_index
+from src.board.movegen import generate_legal_moves
+from src.board.position import create_board, get_piece, list_pieces
+from src.board.zobrist import BLACK_TO_MOVE_KEY, compute_hash, piece_key
+from src.engine.evaluation import PIECE_VALUES
+from src.game.move import Move
+
+PIECE_TYPES = ["pawn", "knight", "bishop", "rook", "queen", "king"]
+PIECE_POINTS = {"pawn": 1, "knight": 3, "bishop": 3, "rook": 5, "queen": 9, "king": 0}  # Shown in the side panels
+FIFTY_MOVE_PLIES = 100  # Halfmoves without a capture or pawn move before the game is drawn
+DRAW_REASONS = {
+    "stalemate": "stalemate",
+    "repetition": "threefold repetition",
+    "fifty_move": "the fifty-move rule"
+}
+
+
+def get_square_notation(row, col):
+    """Convert row and column to chess notation (e.g., 'e4')"""
+    files = 'abcdefgh'
+    ranks = '87654321'
+    return f"{files[col]}{ranks[row]}"
+
+
+def get_square_from_notation(square):
+    """Convert chess notation (e.g., 'e4') to (row, col)"""
+    return '87654321'.index(square[1]), 'abcdefgh'.index(square[0])
+
+
+def opponent_of(color):
+    """Return the color playing against the given color"""
+    return "black" if color == "white" else "white"
+
+
+def deserialize_board(board_state):
+    """Convert saved board state back to piece objects"""
+    board = [[None for _ in range(8)] for _ in range(8)]
+    for row in range(8):
+        for col in range(8):
+            piece_data = board_state[row][col]
+            if piece_data and isinstance(piece_data, dict):  # Check if it's a piece (dictionary)
+                board[row][col] = get_piece(piece_data['color'], piece_data['position'])
+            else:
+                board[row][col] = None  # Empty square
+
+    return board
+
+
+def deserialize_moved_mask(board_state):
+    """Get the mask of squares whose piece has moved from a saved board state"""
+    moved_mask = 0
+    for row in range(8):
+        for col in range(8):
+            piece_data = board_state[row][col]
+            if piece_data and isinstance(piece_data, dict) and piece_data.get('has_moved'):
+                moved_mask |= 1 << (row * 8 + col)
+    return moved_mask
+
+
+def deserialize_captured_pieces(captured_data):
+    """Convert saved captured pieces back to piece objects"""
+    captured = {"white": [], "black": []}
+    for color in ["white", "black"]:
+        for piece_data in captured_data[color]:
+            captured[color].append(get_piece(piece_data['color'], piece_data['position']))
+
+    return captured
+
+
+class GameState:
+    """Chess rules and game record, free of pygame so games can run headless"""
+
+    def __init__(self, board=None, current_turn="white", captured_pieces=None,
+                 move_history=None, move_count=1, moved_mask=0):
+        self.board = board if board is not None else create_board()
+        # Bit row * 8 + col is set when the piece on that square has moved
+        self.moved_mask = moved_mask
+        self.current_turn = current_turn
+        self.captured_pieces = captured_pieces if captured_pieces is not None else {"white": [], "black": []}
+        self.move_history = move_history if move_history is not None else []
+        self.move_count = move_count
+        self.king_squares = {color: locate_king(self.board, color) for color in ("white", "black")}
+        # Squares and piece types of each color, so nothing has to scan all 64 squares for them
+        self.piece_lists = list_pieces(self.board)
+        # Kept in step with the board when the bitboard move generator is selected
+        self.bitboards = Bitboards.from_board(self.board) if MOVE_GENERATOR == "bitboard" else None
+        self._count_material()
+        self.hash = compute_hash(self.board, self.current_turn)
+        self.move_stack = []
+        # Save data of the position the move stack starts from, None for the standard start
+        self.start_position = None
+
+        # Draw rules: plies since the last capture or pawn move, and the hash
+        # of the position before each move on the move stack
+        self.halfmove_clock = 0
+        self.hash_history = []
+
+    @classmethod
+    def from_save_data(cls, save_data):
+        """Build a game state from the dict written by GameSaver.save_game"""
+        state = cls(
+            board=deserialize_board(save_data["board_state"]),
+            current_turn=save_data["current_turn"],
+            captured_pieces=deserialize_captured_pieces(save_data["captured_pieces"]),
+            move_history=list(save_data["move_history"]),
+            move_count=save_data["move_count"],
+            moved_mask=deserialize_moved_mask(save_data["board_state"])
+        )
+        state.start_position = save_data
+        return state
+
+    def _count_material(self):
+        """Set up the material counters from the piece lists and captured pieces.
+
+        piece_counts and material (in centipawns) describe the pieces on the
+        board. capture_counts and capture_points describe what each color has
+        captured. Moves, captures and promotions update all of them in place.
+        """
+        self.piece_counts = {}
+        self.material = {}
+        self.capture_counts = {}
+        self.capture_points = {}
+        for color in ("white", "black"):
+            counts = dict.fromkeys(PIECE_TYPES, 0)
+            for piece_type in self.piece_lists[color].values():
+                counts[piece_type] += 1
+            self.piece_counts[color] = counts
+            self.material[color] = sum(PIECE_VALUES[piece_type] * n for piece_type, n in counts.items())
+
+            captures = dict.fromkeys(PIECE_TYPES, 0)
+            for piece in self.captured_pieces[color]:
+                captures[piece.position] += 1
+            self.capture_counts[color] = captures
+            self.capture_points[color] = sum(PIECE_POINTS[piece_type] * n for piece_type, n in captures.items())
+
+    def material_signature(self):
+        """Get the counts of each piece type on the board for both colors as a hashable tuple"""
+        return tuple(self.piece_counts["white"].values()) + tuple(self.piece_counts["black"].values())
+
+    def switch_turn(self):
+        """Switch the current turn between white and black"""
+        self.current_turn = opponent_of(self.current_turn)
+        self.hash ^= BLACK_TO_MOVE_KEY
+
+    def add_to_move_history(self, piece, source, target, is_capture=False, captured_piece=None,
+                            promotion=None):
+        """Add a move to the history, returning the oldest entry if it was dropped"""
+        move_text = f"{self.move_count}. "
+        if piece.color == "white":
+            move_text += f"White {piece.position.capitalize()} {source}-{target}"
+            if is_capture:
+                move_text += f" x{captured_piece.position.capitalize()}"
+        else:
+            move_text += f"Black {piece.position.capitalize()} {source}-{target}"
+            if is_capture:
+                move_text += f" x{captured_piece.position.capitalize()}"
+            self.move_count += 1
+        if promotion:
+            move_text += f" ={promotion.capitalize()}"
+
+        self.move_history.append(move_text)
+        if len(self.move_history) > 10:  # Keep only last 10 moves
+            return self.move_history.pop(0)
+        return None
+
+    def needs_promotion(self, piece, row):
+        """Check if a pawn needs promotion"""
+        return (piece.position == "pawn" and
+                ((piece.color == "white" and row == 0) or
+                 (piece.color == "black" and row == 7)))
+
+    def make_move(self, move):
+        """Play a Move on the board and push it on the move stack.
+
+        Only the position changes: board, moved mask, captures, king
+        squares, piece lists, hash, draw counters and side to move.
+        unmake_move restores all of them.
+        """
+        piece = self.board[move.from_pos[0]][move.from_pos[1]]
+        move.piece = piece
+        move.moved_mask = self.moved_mask
+        move.halfmove_clock = self.halfmove_clock
+        self.hash_history.append(self.hash)
+        move.captured_piece = self._move_piece(move.from_pos, move.to_pos)
+        from_bit = 1 << (move.from_pos[0] * 8 + move.from_pos[1])
+        to_bit = 1 << (move.to_pos[0] * 8 + move.to_pos[1])
+        self.moved_mask = (self.moved_mask & ~from_bit) | to_bit
+
+        if move.captured_piece:
+            self.captured_pieces[piece.color].append(move.captured_piece)
+            self.capture_counts[piece.color][move.captured_piece.position] += 1
+            self.capture_points[piece.color] += PIECE_POINTS[move.captured_piece.position]
+
+        if self.needs_promotion(piece, move.to_pos[0]):
+            move.promotion = move.promotion or "queen"
+            self._replace_piece(move.to_pos, get_piece(piece.color, move.promotion))
+        else:
+            move.promotion = None
+
+        if move.captured_piece or piece.position == "pawn":
+            self.halfmove_clock = 0  # Irreversible move, no earlier position can repeat
+        else:
+            self.halfmove_clock += 1
+
+        self.switch_turn()
+        self.move_stack.append(move)
+        return move
+
+    def unmake_move(self):
+        """Take back the last move on the move stack and return it"""
+        move = self.move_stack.pop()
+        self.switch_turn()
+
+        if move.history_entry is not None:
+            self.move_history.pop()
+            if move.dropped_history is not None:
+                self.move_history.insert(0, move.dropped_history)
+            self.move_count = move.move_count
+
+        if move.promotion:
+            self._replace_piece(move.to_pos, move.piece)
+        self.moved_mask = move.moved_mask
+        self._unmove_piece(move.from_pos, move.to_pos, move.captured_piece)
+
+        if move.captured_piece:
+            self.captured_pieces[move.piece.color].pop()
+            self.capture_counts[move.piece.color][move.captured_piece.position] -= 1
+            self.capture_points[move.piece.color] -= PIECE_POINTS[move.captured_piece.position]
+
+        self.halfmove_clock = move.halfmove_clock
+        self.hash_history.pop()
+        return move
+
+    def apply_move(self, from_pos, to_pos, promotion="queen"):
+        """Play a move for the side to move and record it in the move history.
+
+        A pawn reaching the last rank is replaced by the promotion piece type.
+        Returns the Move that was played; unmake_move takes it back.
+        """
+        move = self.make_move(Move(from_pos, to_pos, promotion))
+        move.move_count = self.move_count
+        move.dropped_history = self.add_to_move_history(
+            move.piece,
+            get_square_notation(*from_pos),
+            get_square_notation(*to_pos),
+            move.is_capture,
+            move.captured_piece,
+            move.promotion
+        )
+        move.history_entry = self.move_history[-1]
+        return move
+
+    def find_king(self, color):
+        """Return the (row, col) of the king of the given color, or None"""
+        king_pos = self.king_squares.get(color)
+        if king_pos:
+            piece = self.board[king_pos[0]][king_pos[1]]
+            if piece and piece.position == "king" and piece.color == color:
+                return king_pos
+
+        # Tracked square is stale (e.g. the board was replaced), rescan once
+        king_pos = locate_king(self.board, color)
+        self.king_squares[color] = king_pos
+        return king_pos
+
+    def _move_piece(self, from_pos, to_pos):
+        """Move a piece on the board, keeping the king squares, piece lists and hash current.
+
+        Returns the piece that was on the target square so the move can be undone.
+        """
+        captured_piece = self.board[to_pos[0]][to_pos[1]]
+        piece = self.board[from_pos[0]][from_pos[1]]
+        if captured_piece:
+            self.hash ^= piece_key(captured_piece, *to_pos)
+        self.hash ^= piece_key(piece, *from_pos) ^ piece_key(piece, *to_pos)
+        self.board[to_pos[0]][to_pos[1]] = piece
+        self.board[from_pos[0]][from_pos[1]] = None
+        own_pieces = self.piece_lists[piece.color]
+        del own_pieces[from_pos]
+        own_pieces[to_pos] = piece.position
+        if captured_piece:
+            del self.piece_lists[captured_piece.color][to_pos]
+            self.piece_counts[captured_piece.color][captured_piece.position] -= 1
+            self.material[captured_piece.color] -= PIECE_VALUES[captured_piece.position]
+        if piece.position == "king":
+            self.king_squares[piece.color] = to_pos
+        if self.bitboards:
+            self.bitboards.move_piece(square_index(*from_pos), square_index(*to_pos))
+        return captured_piece
+
+    def _unmove_piece(self, from_pos, to_pos, captured_piece):
+        """Undo a _move_piece call and put the captured piece back"""
+        piece = self.board[to_pos[0]][to_pos[1]]
+        self.hash ^= piece_key(piece, *to_pos) ^ piece_key(piece, *from_pos)
+        if captured_piece:
+            self.hash ^= piece_key(captured_piece, *to_pos)
+        self.board[from_pos[0]][from_pos[1]] = piece
+        self.board[to_pos[0]][to_pos[1]] = captured_piece
+        own_pieces = self.piece_lists[piece.color]
+        del own_pieces[to_pos]
+        own_pieces[from_pos] = piece.position
+        if captured_piece:
+            self.piece_lists[captured_piece.color][to_pos] = captured_piece.position
+            self.piece_counts[captured_piece.color][captured_piece.position] += 1
+            self.material[captured_piece.color] += PIECE_VALUES[captured_piece.position]
+        if piece.position == "king":
+            self.king_squares[piece.color] = from_pos
+        if self.bitboards:
+            self.bitboards.unmove_piece(
+                square_index(*from_pos), square_index(*to_pos),
+                (captured_piece.color, captured_piece.position) if captured_piece else None
+            )
+
+    def _replace_piece(self, pos, piece):
+        """Put a different piece on an occupied square, returning the one removed"""
+        old_piece = self.board[pos[0]][pos[1]]
+        self.hash ^= piece_key(old_piece, *pos) ^ piece_key(piece, *pos)
+        self.board[pos[0]][pos[1]] = piece
+        self.piece_lists[piece.color][pos] = piece.position
+        counts = self.piece_counts[piece.color]
+        counts[old_piece.position] -= 1
+        counts[piece.position] += 1
+        self.material[piece.color] += PIECE_VALUES[piece.position] - PIECE_VALUES[old_piece.position]
+        if self.bitboards:
+            self.bitboards.replace_piece(square_index(*pos), piece.color, piece.position)
+        return old_piece
+
+    def get_threatened_pieces(self, attacking_color):
+        """Get all pieces that are under threat from the attacking color"""
+        threatened_pieces = []
+        defending_color = opponent_of(attacking_color)
+
+        # For each attacking piece. simulate_move reorders the piece list, so iterate a sorted copy
+        for row, col in sorted(self.piece_lists[attacking_color]):
+            # Get all possible moves for this piece
+            moves = self.board[row][col].get_valid_moves(self.board, row, col)
+
+            # Check if any of these moves can capture an opponent's piece
+            for move_row, move_col in moves:
+                target_piece = self.board[move_row][move_col]
+                # Simulate the move to check if it's legal (doesn't put own king in check)
+                if (target_piece and target_piece.color == defending_color and
+                        self.simulate_move((row, col), (move_row, move_col))):
+                    threatened_pieces.append((move_row, move_col))
+
+        return threatened_pieces
+
+    def is_king_in_check(self, color):
+        """Check if the king of the given color is in check"""
+        if self.bitboards:
+            return self.bitboards.is_king_in_check(color)
+
+        king_pos = self.find_king(color)
+        if not king_pos:
+            return False
+
+        # Cast rays and jumps outward from the king instead of generating enemy moves
+        return is_square_attacked(self.board, king_pos[0], king_pos[1], opponent_of(color))
+
+    def simulate_move(self, from_pos, to_pos):
+        """Simulate a move and return if it's legal"""
+        if self.bitboards:
+            return self.bitboards.is_legal_move(
+                square_index(*from_pos), square_index(*to_pos)
+            )
+
+        # Make move
+        move = self.make_move(Move(from_pos, to_pos))
+
+        # Check if king is in check after move
+        is_legal = not self.is_king_in_check(move.piece.color)
+
+        # Restore board state
+        self.unmake_move()
+
+        return is_legal
+
+    def get_legal_moves(self, color):
+        """Get a dict mapping each square of the given color to its legal target squares"""
+        if self.bitboards:
+            return self.bitboards.legal_moves(color)
+
+        # Sorted so moves come out in board order however the piece lists were updated
+        return generate_legal_moves(self.board, color, self.find_king(color), sorted(self.piece_lists[color]))
+
+    def legal_move_masks(self, color):
+        """Get a (from_square, target_mask) pair for every piece of a color with a legal move.
+
+        Squares are numbered row * 8 + col. The bitboard backend generates
+        these directly, the Piece backend's move table is converted.
+        """
+        if self.bitboards:
+            return self.bitboards.legal_move_masks(color)
+        moves = []
+        for (row, col), targets in self.get_legal_moves(color).items():
+            mask = 0
+            for target_row, target_col in targets:
+                mask |= 1 << (target_row * 8 + target_col)
+            if mask:
+                moves.append((row * 8 + col, mask))
+        return moves
+
+    def legal_moves(self):
+        """Get every legal (from_pos, to_pos) move for the side to move"""
+        return [
+            (from_pos, to_pos)
+            for from_pos, targets in self.get_legal_moves(self.current_turn).items()
+            for to_pos in targets
+        ]
+
+    def repetition_count(self):
+        """Count how often the current position occurred before.
+
+        Only positions since the last capture or pawn move can repeat, and only
+        with the same side to move, so just every second hash of the last
+        halfmove_clock plies is compared.
+        """
+        history = self.hash_history
+        oldest = max(len(history) - self.halfmove_clock, 0)
+        return sum(1 for i in range(len(history) - 2, oldest - 1, -2) if history[i] == self.hash)
+
+    def outcome(self, legal_moves=None):
+        """Get the result of the game, or None while it goes on.
+
+        Returns a dict with the 'result' ("checkmate", "stalemate",
+        "repetition" or "fifty_move") and the 'winner' color (None for a
+        draw). legal_moves is the side to move's table from get_legal_moves
+        when the caller already has it, so mate and stalemate need no second
+        generation pass.
+        """
+        if legal_moves is None:
+            legal_moves = self.get_legal_moves(self.current_turn)
+        if not any(legal_moves.values()):
+            if self.is_king_in_check(self.current_turn):
+                return {"result": "checkmate", "winner": opponent_of(self.current_turn)}
+            return {"result": "stalemate", "winner": None}
+        if self.halfmove_clock >= FIFTY_MOVE_PLIES:
+            return {"result": "fifty_move", "winner": None}
+        if self.repetition_count() >= 2:
+            return {"result": "repetition", "winner": None}
+        return None
+
+    def position_key(self):
+        """Get the Zobrist hash identifying the current position"""
+        return self.hash
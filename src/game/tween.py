@@ -0,0 +1,44 @@
+def linear(progress):
+    """No easing"""
+    return progress
+
+
+def ease_out_cubic(progress):
+    """Fast start that slows down towards the end"""
+    return 1 - (1 - progress) ** 3
+
+
+class Tween:
+    """Interpolates a number or a tuple of numbers over a fixed duration.
+
+    Progress is measured against the clock rather than counted in frames, so
+    an animation takes the same time whatever the frame rate is.
+    """
+
+    def __init__(self, start, end, duration, start_time, easing=ease_out_cubic, on_complete=None):
+        self.start = start
+        self.end = end
+        self.duration = duration  # Seconds
+        self.start_time = start_time  # Milliseconds, as from pygame.time.get_ticks()
+        self.easing = easing
+        self.on_complete = on_complete
+        self.progress = 0.0
+
+    @property
+    def done(self):
+        """Whether the tween has reached its end value"""
+        return self.progress >= 1
+
+    @property
+    def value(self):
+        """Current eased value between start and end"""
+        t = self.easing(self.progress)
+        if isinstance(self.start, tuple):
+            return tuple(a + (b - a) * t for a, b in zip(self.start, self.end))
+        return self.start + (self.end - self.start) * t
+
+    def update(self, now):
+        """Advance the tween to the time now in milliseconds and return whether it is done"""
+        elapsed = (now - self.start_time) / 1000
+        self.progress = min(1.0, elapsed / self.duration) if self.duration > 0 else 1.0
+        return self.done
@@ -1,15 +1,23 @@
 import pygame
 from config.settings import *
 from src.utils.logger import logger
+from src.utils.text_cache import TextCache
 
 class Menu:
     def __init__(self, screen):
         self.screen = screen
         self.buttons = []
         self.selected_button = None
+        self.needs_redraw = True
         self.font_title = pygame.font.Font(None, MENU_TITLE_SIZE)
         self.font_button = pygame.font.Font(None, MENU_BUTTON_TEXT_SIZE)
         self.font_subtitle = pygame.font.Font(None, MENU_SUBTITLE_SIZE)
+        self.text_cache = TextCache(TEXT_CACHE_SIZE)
+        
+        # Semi-transparent overlay over the background, reused every frame
+        self.overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.overlay.fill(MENU_BG)
+        self.overlay.set_alpha(MENU_PANEL_ALPHA)
         
         # Load background image
         try:
@@ -34,13 +42,24 @@ class Menu:
                 'action': 'new_game'
             },
             {
-                'text': MENU_BUTTON_SAVE_GAME,
+                'text': MENU_BUTTON_COMPUTER_GAME,
                 'rect': pygame.Rect(
                     (WINDOW_WIDTH - MENU_BUTTON_WIDTH) // 2,
                     button_y + MENU_BUTTON_HEIGHT + MENU_BUTTON_SPACING,
                     MENU_BUTTON_WIDTH,
                     MENU_BUTTON_HEIGHT
                 ),
+                'color': MENU_BUTTON_BG,
+                'action': 'computer_game'
+            },
+            {
+                'text': MENU_BUTTON_SAVE_GAME,
+                'rect': pygame.Rect(
+                    (WINDOW_WIDTH - MENU_BUTTON_WIDTH) // 2,
+                    button_y + (MENU_BUTTON_HEIGHT + MENU_BUTTON_SPACING) * 2,
+                    MENU_BUTTON_WIDTH,
+                    MENU_BUTTON_HEIGHT
+                ),
                 'color': MENU_BUTTON_SAVE,
                 'action': 'save_game'
             },
@@ -48,7 +67,7 @@ class Menu:
                 'text': MENU_BUTTON_LOAD_GAME,
                 'rect': pygame.Rect(
                     (WINDOW_WIDTH - MENU_BUTTON_WIDTH) // 2,
-                    button_y + (MENU_BUTTON_HEIGHT + MENU_BUTTON_SPACING) * 2,
+                    button_y + (MENU_BUTTON_HEIGHT + MENU_BUTTON_SPACING) * 3,
                     MENU_BUTTON_WIDTH,
                     MENU_BUTTON_HEIGHT
                 ),
@@ -59,7 +78,7 @@ class Menu:
                 'text': MENU_BUTTON_QUIT,
                 'rect': pygame.Rect(
                     (WINDOW_WIDTH - MENU_BUTTON_WIDTH) // 2,
-                    button_y + (MENU_BUTTON_HEIGHT + MENU_BUTTON_SPACING) * 3,
+                    button_y + (MENU_BUTTON_HEIGHT + MENU_BUTTON_SPACING) * 4,
                     MENU_BUTTON_WIDTH,
                     MENU_BUTTON_HEIGHT
                 ),
@@ -72,11 +91,17 @@ class Menu:
         """Handle menu events"""
         if event.type == pygame.MOUSEMOTION:
             # Check for button hover
-            self.selected_button = None
+            hovered = None
             for button in self.buttons:
                 if button['rect'].collidepoint(event.pos):
-                    self.selected_button = button
+                    hovered = button
                     break
+            if hovered is not self.selected_button:
+                self.selected_button = hovered
+                self.needs_redraw = True
+        
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self.needs_redraw = True
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
@@ -87,8 +112,16 @@ class Menu:
         
         return None
 
+    def request_redraw(self):
+        """Redraw the menu on the next frame, e.g. after the game drew over it"""
+        self.needs_redraw = True
+
     def draw(self):
-        """Draw the menu"""
+        """Draw the menu if anything changed since it was last drawn"""
+        if not self.needs_redraw:
+            return False
+        self.needs_redraw = False
+        
         # Draw background
         if self.bg_image:
             self.screen.blit(self.bg_image, (0, 0))
@@ -96,22 +129,19 @@ class Menu:
             self.screen.fill(MENU_BG)
         
         # Draw semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.fill(MENU_BG)
-        overlay.set_alpha(MENU_PANEL_ALPHA)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.overlay, (0, 0))
         
         # Draw title
-        title_text = self.font_title.render("Chess Game", True, MENU_TITLE_COLOR)
+        title_text = self.text_cache.render(self.font_title, "Chess Game", MENU_TITLE_COLOR)
         title_rect = title_text.get_rect(
             center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3)
         )
         self.screen.blit(title_text, title_rect)
         
         # Draw subtitle
-        subtitle_text = self.font_subtitle.render(
+        subtitle_text = self.text_cache.render(
+            self.font_subtitle,
             "A Modern Chess Implementation",
-            True,
             SECONDARY
         )
         subtitle_rect = subtitle_text.get_rect(
@@ -148,8 +178,9 @@ class Menu:
             )
             
             # Draw button text
-            text = self.font_button.render(button['text'], True, TEXT_COLOR)
+            text = self.text_cache.render(self.font_button, button['text'], TEXT_COLOR)
             text_rect = text.get_rect(center=button['rect'].center)
             self.screen.blit(text, text_rect)
         
-        pygame.display.flip() 
\ No newline at end of file
+        pygame.display.flip()
+        return True
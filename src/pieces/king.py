@@ -1,6 +1,8 @@
 from src.pieces.piece import Piece
 
 class King(Piece):
+    __slots__ = ()
+
     def get_valid_moves(self, board, current_row, current_col):
         """Get all valid moves for the king"""
         moves = []
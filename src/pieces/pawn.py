@@ -1,6 +1,8 @@
 from src.pieces.piece import Piece
 
 class Pawn(Piece):
+    __slots__ = ()
+
     def get_valid_moves(self, board, current_row, current_col):
         """Get all valid moves for the pawn"""
         moves = []
@@ -11,8 +13,8 @@ class Pawn(Piece):
         if self.is_valid_position(new_row, current_col) and board[new_row][current_col] is None:
             moves.append((new_row, current_col))
             
-            # First move - can move two squares
-            if not self.has_moved:
+            # First move - can move two squares. A pawn on its starting rank has never moved
+            if current_row == (6 if self.color == "white" else 1):
                 new_row = current_row + (direction * 2)
                 if self.is_valid_position(new_row, current_col) and board[new_row][current_col] is None:
                     moves.append((new_row, current_col))
@@ -1,8 +1,28 @@
 class Piece:
+    """Immutable chess piece.
+
+    There is one shared instance per color and type (see get_piece), so a
+    board is 64 references and copying one never copies pieces. Whether a
+    piece has moved belongs to the position, not the piece.
+    """
+
+    __slots__ = ("color", "position")
+
     def __init__(self, color, piece_type):
-        self.color = color  # 'white' or 'black'
-        self.position = piece_type  # The type of piece (e.g., "rook", "pawn")
-        self.has_moved = False
+        object.__setattr__(self, "color", color)  # 'white' or 'black'
+        object.__setattr__(self, "position", piece_type)  # The type of piece (e.g., "rook", "pawn")
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} objects are shared and cannot be changed")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.color!r})"
 
     def is_valid_position(self, row, col):
         """Check if the position is within the board boundaries"""
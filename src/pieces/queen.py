@@ -1,6 +1,8 @@
 from src.pieces.piece import Piece
 
 class Queen(Piece):
+    __slots__ = ()
+
     def get_valid_moves(self, board, current_row, current_col):
         """Get all valid moves for the queen"""
         straight_moves = self.get_straight_moves(board, current_row, current_col)
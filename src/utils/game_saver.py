@@ -1,8 +1,237 @@
 import json
 import os
+import re
+import sqlite3
+import struct
+import threading
+import time
+from contextlib import closing
 from datetime import datetime
+from src.game.state import GameState, get_square_from_notation, get_square_notation
+from src.utils.journal import JOURNAL_EXTENSION, GameJournal, replay_journal
 from src.utils.logger import logger
 
+# Compact binary save format. A position is a 32-byte board with one 4-bit
+# piece code per square, a 64-bit mask of pieces that have moved and a flags
+# byte. Moves take 16 bits: from square, to square and promotion piece.
+BINARY_EXTENSION = ".bin"
+BINARY_MAGIC = b"CG"
+BINARY_VERSION = 1
+PIECE_CODES = {"pawn": 1, "knight": 2, "bishop": 3, "rook": 4, "queen": 5, "king": 6}
+PIECE_TYPES = {code: piece_type for piece_type, code in PIECE_CODES.items()}
+BLACK_BIT = 0x8
+PROMOTION_CODES = {None: 0, "knight": 1, "bishop": 2, "rook": 3, "queen": 4}
+PROMOTION_TYPES = {code: piece_type for piece_type, code in PROMOTION_CODES.items()}
+FLAG_BLACK_TO_MOVE = 0x1
+FLAG_GAME_OVER = 0x2
+
+POSITION_STRUCT = struct.Struct("<32sQB")  # Board, moved mask, flags
+HEADER_STRUCT = struct.Struct("<2sBHdd")  # Magic, version, move count, white and black clocks
+HISTORY_STRUCT = struct.Struct("<HHBB")  # Move number, move, moving piece, captured piece
+HISTORY_PATTERN = re.compile(
+    r"^(\d+)\. (White|Black) (\w+) ([a-h][1-8])-([a-h][1-8])(?: x(\w+))?(?: =(\w+))?$"
+)
+HISTORY_STRUCTURED = 0
+HISTORY_TEXT = 1  # Entries that do not follow the usual pattern are kept as text
+
+# Catalog of saves with their metadata, so listing never touches the save files
+CATALOG_FILENAME = "catalog.sqlite3"
+CATALOG_VERSION = 1  # Stored as the user_version once the catalog was built from the save files
+SAVE_EXTENSIONS = ('.json', BINARY_EXTENSION, JOURNAL_EXTENSION)
+CATALOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    filename TEXT PRIMARY KEY,
+    saved_at REAL NOT NULL,
+    side_to_move TEXT NOT NULL,
+    move_count INTEGER NOT NULL,
+    result TEXT,
+    winner TEXT,
+    white_material INTEGER NOT NULL,
+    black_material INTEGER NOT NULL,
+    position_hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS saves_saved_at ON saves (saved_at);
+CREATE INDEX IF NOT EXISTS saves_position_hash ON saves (position_hash);
+CREATE INDEX IF NOT EXISTS saves_result ON saves (result, saved_at);
+"""
+CATALOG_COLUMNS = [
+    "filename", "saved_at", "side_to_move", "move_count", "result", "winner",
+    "white_material", "black_material", "position_hash"
+]
+
+
+def encode_piece(piece_type, color):
+    """Get the 4-bit code of a piece"""
+    return PIECE_CODES[piece_type] | (BLACK_BIT if color == "black" else 0)
+
+
+def decode_piece(code):
+    """Get the (type, color) of a 4-bit piece code"""
+    return PIECE_TYPES[code & ~BLACK_BIT], "black" if code & BLACK_BIT else "white"
+
+
+def encode_move(from_pos, to_pos, promotion=None):
+    """Pack a move into 16 bits: from square, to square and promotion piece"""
+    from_index = from_pos[0] * 8 + from_pos[1]
+    to_index = to_pos[0] * 8 + to_pos[1]
+    return from_index | (to_index << 6) | (PROMOTION_CODES[promotion] << 12)
+
+
+def decode_move(value):
+    """Unpack a 16-bit move into (from_pos, to_pos, promotion)"""
+    from_index = value & 0x3F
+    to_index = (value >> 6) & 0x3F
+    return divmod(from_index, 8), divmod(to_index, 8), PROMOTION_TYPES[value >> 12]
+
+
+def encode_moves(moves):
+    """Pack a list of (from_pos, to_pos, promotion) moves at 2 bytes per move"""
+    return struct.pack(f"<{len(moves)}H", *(encode_move(*move) for move in moves))
+
+
+def decode_moves(data):
+    """Unpack a move list written by encode_moves"""
+    return [decode_move(value) for value in struct.unpack(f"<{len(data) // 2}H", data)]
+
+
+def encode_position(board_state, current_turn, game_over=False):
+    """Pack a serialized board, side to move and game over flag into 41 bytes"""
+    nibbles = []
+    moved_mask = 0
+    for row in range(8):
+        for col in range(8):
+            piece_data = board_state[row][col]
+            if piece_data:
+                nibbles.append(encode_piece(piece_data['position'], piece_data['color']))
+                if piece_data.get('has_moved'):
+                    moved_mask |= 1 << (row * 8 + col)
+            else:
+                nibbles.append(0)
+
+    board = bytes((nibbles[i] << 4) | nibbles[i + 1] for i in range(0, 64, 2))
+    flags = (FLAG_BLACK_TO_MOVE if current_turn == "black" else 0) | (FLAG_GAME_OVER if game_over else 0)
+    return POSITION_STRUCT.pack(board, moved_mask, flags)
+
+
+def decode_position(data):
+    """Unpack a position written by encode_position into (board_state, current_turn, game_over)"""
+    board, moved_mask, flags = POSITION_STRUCT.unpack(data)
+    board_state = []
+    for row in range(8):
+        board_row = []
+        for col in range(8):
+            index = row * 8 + col
+            code = board[index // 2] >> 4 if index % 2 == 0 else board[index // 2] & 0xF
+            if code:
+                piece_type, color = decode_piece(code)
+                board_row.append({
+                    'position': piece_type,
+                    'color': color,
+                    'has_moved': bool(moved_mask >> index & 1)
+                })
+            else:
+                board_row.append("")
+        board_state.append(board_row)
+    current_turn = "black" if flags & FLAG_BLACK_TO_MOVE else "white"
+    return board_state, current_turn, bool(flags & FLAG_GAME_OVER)
+
+
+def _encode_history_entry(move_text):
+    """Pack one move history line, as 7 bytes when it follows the usual pattern"""
+    match = HISTORY_PATTERN.match(move_text)
+    if match:
+        number, color, piece, source, target, captured, promotion = match.groups()
+        try:
+            move = encode_move(
+                get_square_from_notation(source),
+                get_square_from_notation(target),
+                promotion.lower() if promotion else None
+            )
+            captured_code = encode_piece(captured.lower(), "white") if captured else 0
+            return bytes([HISTORY_STRUCTURED]) + HISTORY_STRUCT.pack(
+                int(number), move, encode_piece(piece.lower(), color.lower()), captured_code
+            )
+        except (KeyError, struct.error):
+            pass  # Unknown piece name or out of range number, keep the text
+    text = move_text.encode("utf-8")
+    return bytes([HISTORY_TEXT, len(text)]) + text
+
+
+def _decode_history_entry(data, offset):
+    """Unpack one move history line at offset, returning (move_text, next_offset)"""
+    tag = data[offset]
+    offset += 1
+    if tag == HISTORY_TEXT:
+        length = data[offset]
+        return data[offset + 1:offset + 1 + length].decode("utf-8"), offset + 1 + length
+
+    number, move, mover_code, captured_code = HISTORY_STRUCT.unpack_from(data, offset)
+    from_pos, to_pos, promotion = decode_move(move)
+    piece_type, color = decode_piece(mover_code)
+    move_text = (f"{number}. {color.capitalize()} {piece_type.capitalize()} "
+                 f"{get_square_notation(*from_pos)}-{get_square_notation(*to_pos)}")
+    if captured_code:
+        move_text += f" x{decode_piece(captured_code)[0].capitalize()}"
+    if promotion:
+        move_text += f" ={promotion.capitalize()}"
+    return move_text, offset + HISTORY_STRUCT.size
+
+
+def encode_save_data(save_data):
+    """Pack the save data dict written to JSON saves into the binary format"""
+    parts = [
+        HEADER_STRUCT.pack(
+            BINARY_MAGIC, BINARY_VERSION, save_data["move_count"],
+            save_data["time_left"]["white"], save_data["time_left"]["black"]
+        ),
+        encode_position(save_data["board_state"], save_data["current_turn"], save_data["game_over"])
+    ]
+    for color in ["white", "black"]:
+        captured = save_data["captured_pieces"][color]
+        parts.append(bytes([len(captured)]))
+        parts.append(bytes(encode_piece(piece['position'], piece['color']) for piece in captured))
+
+    history = save_data["move_history"]
+    parts.append(bytes([len(history)]))
+    parts.extend(_encode_history_entry(move_text) for move_text in history)
+    return b"".join(parts)
+
+
+def decode_save_data(data):
+    """Unpack binary save data into the same dict JSON saves hold"""
+    magic, version, move_count, white_time, black_time = HEADER_STRUCT.unpack_from(data)
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError("Not a binary chess save")
+    offset = HEADER_STRUCT.size
+    board_state, current_turn, game_over = decode_position(data[offset:offset + POSITION_STRUCT.size])
+    offset += POSITION_STRUCT.size
+
+    captured_pieces = {}
+    for color in ["white", "black"]:
+        count = data[offset]
+        captured_pieces[color] = []
+        for code in data[offset + 1:offset + 1 + count]:
+            piece_type, piece_color = decode_piece(code)
+            captured_pieces[color].append({'position': piece_type, 'color': piece_color})
+        offset += 1 + count
+
+    move_history = []
+    count = data[offset]
+    offset += 1
+    for _ in range(count):
+        move_text, offset = _decode_history_entry(data, offset)
+        move_history.append(move_text)
+
+    return {
+        "board_state": board_state,
+        "current_turn": current_turn,
+        "time_left": {"white": white_time, "black": black_time},
+        "move_history": move_history,
+        "captured_pieces": captured_pieces,
+        "move_count": move_count,
+        "game_over": game_over
+    }
+
 class GameSaver:
     def __init__(self, save_dir="saved_games"):
         """Initialize the GameSaver with a directory for saved games"""
@@ -10,29 +239,37 @@ class GameSaver:
         if not os.path.exists(save_dir):
             os.makedirs(save_dir)
 
-    def save_game(self, game_state):
-        """Save the current game state to a JSON file"""
+        # A catalog that was never filled from the directory needs a rebuild. That
+        # parses every save, so the game runs ensure_catalog on its save worker;
+        # catalog queries made before then wait for it or run it themselves
+        self.catalog_path = os.path.join(save_dir, CATALOG_FILENAME)
+        self.catalog_needs_rebuild = False
+        self.catalog_lock = threading.Lock()
+        try:
+            with closing(self._connect()) as conn:
+                conn.executescript(CATALOG_SCHEMA)
+                self.catalog_needs_rebuild = conn.execute("PRAGMA user_version").fetchone()[0] < CATALOG_VERSION
+        except sqlite3.Error as e:
+            logger.error(f"Error opening save catalog: {str(e)}")
+
+    def save_game(self, game_state, binary=False):
+        """Save the current game state to a JSON file, or a compact binary file"""
         try:
             # Create a timestamp for the filename
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"chess_game_{timestamp}.json"
+            filename = f"chess_game_{timestamp}{BINARY_EXTENSION if binary else '.json'}"
             filepath = os.path.join(self.save_dir, filename)
 
             # Convert game state to serializable format
-            save_data = {
-                "board_state": self._serialize_board(game_state.board),
-                "current_turn": game_state.current_turn,
-                "time_left": game_state.time_left,
-                "move_history": game_state.move_history,
-                "captured_pieces": self._serialize_captured_pieces(game_state.captured_pieces),
-                "move_count": game_state.move_count,
-                "game_over": game_state.game_over
-            }
+            save_data = self.build_save_data(game_state, game_state.time_left, game_state.game_over)
 
             # Save to file
-            with open(filepath, 'w') as f:
-                json.dump(save_data, f, indent=4)
+            if binary:
+                self._write_atomic(filepath, encode_save_data(save_data))
+            else:
+                self._write_atomic(filepath, json.dumps(save_data, indent=4).encode())
 
+            self.catalog_save(filename, save_data)
             logger.info(f"Game saved successfully to {filename}")
             return filename
 
@@ -40,13 +277,58 @@ class GameSaver:
             logger.error(f"Error saving game: {str(e)}")
             return None
 
-    def load_game(self, filename):
-        """Load a game state from a JSON file"""
+    def build_save_data(self, state, time_left, game_over):
+        """Convert a game state and its clocks to the serializable save format"""
+        return {
+            "board_state": self._serialize_board(state.board, state.moved_mask),
+            "current_turn": state.current_turn,
+            "time_left": dict(time_left),
+            "move_history": list(state.move_history),
+            "captured_pieces": self._serialize_captured_pieces(state.captured_pieces),
+            "move_count": state.move_count,
+            "game_over": game_over
+        }
+
+    def new_journal(self):
+        """Create a journal with a new timestamped filename, without writing anything yet"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return GameJournal(os.path.join(self.save_dir, f"chess_game_{timestamp}{JOURNAL_EXTENSION}"))
+
+    def start_journal(self, journal, save_data, game=None):
+        """Write the first checkpoint of a new journal, with its game record, and add it to the catalog"""
         try:
-            filepath = os.path.join(self.save_dir, filename)
-            with open(filepath, 'r') as f:
-                save_data = json.load(f)
+            journal.start(save_data, game)
+            self.catalog_save(journal.filename, save_data)
+            logger.info(f"Started game journal {journal.filename}")
+            return True
 
+        except Exception as e:
+            logger.error(f"Error starting game journal: {str(e)}")
+            return False
+
+    def sync_journal(self, journal, save_data):
+        """Sync a journal to disk and refresh its catalog entry"""
+        try:
+            journal.sync()
+            self.catalog_save(journal.filename, save_data)
+            return True
+        except Exception as e:
+            logger.error(f"Error syncing game journal: {str(e)}")
+            return False
+
+    def refresh_journal(self, journal, entry):
+        """Refresh a journal's catalog entry from catalog_entry columns, unless the journal never started"""
+        if journal.started:
+            self.catalog_update(journal.filename, entry)
+
+    def resume_journal(self, filename):
+        """Get the journal of a saved game so further moves are appended to it"""
+        return GameJournal(os.path.join(self.save_dir, filename), started=True)
+
+    def load_game(self, filename):
+        """Load a game state from a JSON file, a binary file or a move journal"""
+        try:
+            save_data = self._read_save_data(filename)
             logger.info(f"Game loaded successfully from {filename}")
             return save_data
 
@@ -54,28 +336,85 @@ class GameSaver:
             logger.error(f"Error loading game: {str(e)}")
             return None
 
-    def list_saved_games(self):
-        """List all saved game files"""
+    def load_game_state(self, filename):
+        """Load a save as (state, save_data), or None if it cannot be read.
+
+        A journal's state is the replayed game itself, so its move stack holds
+        every move since the game started.
+        """
         try:
-            saved_games = []
-            for filename in os.listdir(self.save_dir):
-                if filename.endswith('.json'):
-                    filepath = os.path.join(self.save_dir, filename)
-                    timestamp = os.path.getmtime(filepath)
-                    date = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
-                    saved_games.append({
-                        'filename': filename,
-                        'date': date
-                    })
-            return sorted(saved_games, key=lambda x: x['date'], reverse=True)
+            if filename.endswith(JOURNAL_EXTENSION):
+                state, time_left, game_over = replay_journal(os.path.join(self.save_dir, filename))
+                save_data = self.build_save_data(state, time_left, game_over)
+            else:
+                save_data = self._read_save_data(filename)
+                state = GameState.from_save_data(save_data)
+            logger.info(f"Game loaded successfully from {filename}")
+            return state, save_data
+
         except Exception as e:
+            logger.error(f"Error loading game: {str(e)}")
+            return None
+
+    def list_saved_games(self, limit=None, offset=0, side_to_move=None, result=None):
+        """List saved games from the catalog, newest first.
+
+        Every entry has the 'filename' and 'date' plus the catalog metadata:
+        side to move, move count, result, winner, material of each side in
+        centipawns and position hash. Filter by side_to_move or result (use
+        "ongoing" for unfinished games) and page with limit and offset.
+        """
+        conditions = []
+        params = []
+        if side_to_move:
+            conditions.append("side_to_move = ?")
+            params.append(side_to_move)
+        if result == "ongoing":
+            conditions.append("result IS NULL")
+        elif result:
+            conditions.append("result = ?")
+            params.append(result)
+
+        self.ensure_catalog()
+        query = f"SELECT {', '.join(CATALOG_COLUMNS)} FROM saves"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY saved_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit if limit is not None else -1, offset])
+
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(query, params).fetchall()
+        except sqlite3.Error as e:
             logger.error(f"Error listing saved games: {str(e)}")
             return []
 
+        saved_games = []
+        for row in rows:
+            entry = dict(zip(CATALOG_COLUMNS, row))
+            entry['date'] = datetime.fromtimestamp(entry['saved_at']).strftime("%Y-%m-%d %H:%M:%S")
+            saved_games.append(entry)
+        return saved_games
+
+    def find_saves_by_hash(self, position_hash):
+        """List the filenames of saves whose current position has the given Zobrist hash"""
+        self.ensure_catalog()
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    "SELECT filename FROM saves WHERE position_hash = ? ORDER BY saved_at DESC",
+                    (f"{position_hash:016x}",)
+                ).fetchall()
+            return [row[0] for row in rows]
+        except sqlite3.Error as e:
+            logger.error(f"Error searching saved games: {str(e)}")
+            return []
+
     def delete_save(self, filename):
-        """Delete a saved game file"""
+        """Delete a saved game file and its catalog entry"""
         try:
             filepath = os.path.join(self.save_dir, filename)
+            self.catalog_remove(filename)
             if os.path.exists(filepath):
                 os.remove(filepath)
                 logger.info(f"Deleted save file: {filename}")
@@ -85,8 +424,118 @@ class GameSaver:
             logger.error(f"Error deleting save file: {str(e)}")
             return False
 
-    def _serialize_board(self, board):
-        """Convert the board state to a serializable format"""
+    def catalog_entry(self, state, time_left, outcome):
+        """Get the catalog columns of a game other than its filename and save time.
+
+        outcome is the game's checkmate or draw from state.outcome(), or None.
+        """
+        if time_left["white"] <= 0 or time_left["black"] <= 0:
+            result = "timeout"
+            winner = "black" if time_left["white"] <= 0 else "white"
+        elif outcome:
+            result = outcome["result"]
+            winner = outcome["winner"]
+        else:
+            result = winner = None
+        material = state.material
+        return [
+            state.current_turn, state.move_count, result, winner,
+            material["white"], material["black"], f"{state.hash:016x}"
+        ]
+
+    def catalog_save(self, filename, save_data, saved_at=None):
+        """Add or refresh the catalog entry of a save"""
+        state = GameState.from_save_data(save_data)
+        self.catalog_update(filename, self.catalog_entry(state, save_data["time_left"], state.outcome()), saved_at)
+
+    def catalog_update(self, filename, entry, saved_at=None):
+        """Add or refresh the catalog entry of a save from its catalog_entry columns"""
+        try:
+            with closing(self._connect()) as conn, conn:
+                self._insert_catalog_row(conn, filename, entry, saved_at)
+        except sqlite3.Error as e:
+            logger.error(f"Error updating save catalog: {str(e)}")
+
+    def catalog_remove(self, filename):
+        """Drop the catalog entry of a save"""
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM saves WHERE filename = ?", (filename,))
+        except sqlite3.Error as e:
+            logger.error(f"Error updating save catalog: {str(e)}")
+
+    def ensure_catalog(self):
+        """Build the catalog from the save files if that never happened"""
+        with self.catalog_lock:
+            if self.catalog_needs_rebuild:
+                self.rebuild_catalog()
+
+    def rebuild_catalog(self):
+        """Index every save file in the directory from scratch, e.g. after files were copied in.
+
+        All rows go in through one connection and one transaction, so readers
+        see either the old catalog or the complete new one.
+        """
+        indexed = 0
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM saves")
+                for filename in os.listdir(self.save_dir):
+                    if not filename.endswith(SAVE_EXTENSIONS):
+                        continue
+                    try:
+                        save_data = self._read_save_data(filename)
+                        state = GameState.from_save_data(save_data)
+                        entry = self.catalog_entry(state, save_data["time_left"], state.outcome())
+                    except Exception as e:
+                        logger.warning(f"Skipping unreadable save {filename}: {str(e)}")
+                        continue
+                    saved_at = os.path.getmtime(os.path.join(self.save_dir, filename))
+                    self._insert_catalog_row(conn, filename, entry, saved_at)
+                    indexed += 1
+                conn.execute(f"PRAGMA user_version = {CATALOG_VERSION}")
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Error rebuilding save catalog: {str(e)}")
+            return 0
+        self.catalog_needs_rebuild = False
+        logger.info(f"Indexed {indexed} saved games")
+        return indexed
+
+    def _insert_catalog_row(self, conn, filename, entry, saved_at=None):
+        """Insert or replace one catalog row on an open connection"""
+        conn.execute(
+            f"INSERT OR REPLACE INTO saves ({', '.join(CATALOG_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(CATALOG_COLUMNS))})",
+            [filename, saved_at if saved_at is not None else time.time()] + entry
+        )
+
+    def _connect(self):
+        """Open a connection to the catalog; one per call so any thread can use it"""
+        return sqlite3.connect(self.catalog_path)
+
+    def _write_atomic(self, filepath, data):
+        """Write a file through a temporary file renamed into place, so a crash never leaves half a save"""
+        temp_path = filepath + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, filepath)
+
+    def _read_save_data(self, filename):
+        """Read the save data dict from a save file of any format"""
+        filepath = os.path.join(self.save_dir, filename)
+        if filename.endswith(JOURNAL_EXTENSION):
+            state, time_left, game_over = replay_journal(filepath)
+            return self.build_save_data(state, time_left, game_over)
+        if filename.endswith(BINARY_EXTENSION):
+            with open(filepath, 'rb') as f:
+                return decode_save_data(f.read())
+        with open(filepath, 'r') as f:
+            return json.load(f)
+
+    def _serialize_board(self, board, moved_mask=0):
+        """Convert the board state and the squares whose piece has moved to a serializable format"""
         board_state = []
         for row in range(8):
             board_row = []
@@ -96,7 +545,7 @@ class GameSaver:
                     board_row.append({
                         'position': piece.position,
                         'color': piece.color,
-                        'has_moved': getattr(piece, 'has_moved', False)
+                        'has_moved': bool(moved_mask >> (row * 8 + col) & 1)
                     })
                 else:
                     board_row.append("")
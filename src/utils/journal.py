@@ -0,0 +1,173 @@
+"""Append-only game journal.
+
+A journal is a text file with one compact JSON record per line. A checkpoint
+record holds the whole save data of the game, as written by GameSaver, plus
+the position the game started from and every move played since, and every
+move after it is one short record:
+
+    {"checkpoint":{...},"game":{"start":null,"moves":["e2e4","e7e5"]}}
+    {"move":"g1f3","clock":[57.3,60.0]}
+    {"move":"e7e8q","clock":[41.0,38.2]}
+
+Saving a move costs one appended line. Every record is written through to the
+file right away, so readers always see it, while fsyncs are batched. The
+game writes a new checkpoint every JOURNAL_CHECKPOINT_INTERVAL moves. Resuming
+replays the game record of the last checkpoint and the moves after it, so the
+whole game is rebuilt, not just its last ten history entries.
+"""
+import json
+import os
+
+from config.settings import JOURNAL_SYNC_EVERY
+from src.game.state import GameState, get_square_from_notation, get_square_notation
+
+JOURNAL_EXTENSION = ".journal"
+PROMOTION_LETTERS = {"queen": "q", "rook": "r", "bishop": "b", "knight": "n"}
+PROMOTION_PIECES = {letter: piece for piece, letter in PROMOTION_LETTERS.items()}
+CHECKPOINT_PREFIX = '{"checkpoint"'
+
+
+def encode_move(move):
+    """Write a move as its squares plus a promotion letter, e.g. 'e2e4' or 'e7e8q'"""
+    text = get_square_notation(*move.from_pos) + get_square_notation(*move.to_pos)
+    if move.promotion:
+        text += PROMOTION_LETTERS[move.promotion]
+    return text
+
+
+def decode_move(text):
+    """Read a move written by encode_move as (from_pos, to_pos, promotion)"""
+    promotion = PROMOTION_PIECES[text[4]] if len(text) > 4 else None
+    return get_square_from_notation(text[:2]), get_square_from_notation(text[2:4]), promotion
+
+
+def build_game_record(state):
+    """Get the start position and every move of a game, enough to replay all of it"""
+    return {"start": state.start_position, "moves": [encode_move(move) for move in state.move_stack]}
+
+
+def read_journal(path):
+    """Get the last checkpoint record of a journal and the move records written after it.
+
+    A line cut short by a crash can only be the last one, so reading stops at
+    the first line that does not parse and everything before it is kept.
+    """
+    with open(path, 'r') as f:
+        lines = f.read().splitlines()
+
+    for start in range(len(lines) - 1, -1, -1):
+        if not lines[start].startswith(CHECKPOINT_PREFIX):
+            continue
+        try:
+            checkpoint = json.loads(lines[start])
+        except ValueError:
+            continue  # Torn checkpoint at the end of the file, use the one before it
+        break
+    else:
+        raise ValueError(f"No checkpoint in journal {path}")
+
+    records = []
+    for line in lines[start + 1:]:
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            break
+    return checkpoint, records
+
+
+def replay_journal(path):
+    """Rebuild a journaled game.
+
+    Returns (state, time_left, game_over) after replaying the game record of
+    the last checkpoint and every move written since. Journals written before
+    checkpoints carried a game record start from the checkpoint position.
+    """
+    checkpoint, records = read_journal(path)
+    save_data = checkpoint["checkpoint"]
+    game = checkpoint.get("game")
+    if game is None:
+        state = GameState.from_save_data(save_data)
+    else:
+        state = GameState.from_save_data(game["start"]) if game["start"] else GameState()
+        for move in game["moves"]:
+            state.apply_move(*decode_move(move))
+    time_left = save_data["time_left"]
+    game_over = save_data["game_over"]
+    for record in records:
+        state.apply_move(*decode_move(record["move"]))
+        time_left = {"white": record["clock"][0], "black": record["clock"][1]}
+
+    if records:
+        game_over = state.outcome() is not None or min(time_left.values()) <= 0
+    return state, time_left, game_over
+
+
+class GameJournal:
+    """Appends checkpoints and moves of one game to its journal file.
+
+    Every write opens the file, appends and closes it again, so a journal can
+    be created on the game thread and then written by the save worker alone.
+    Nothing is appended until start() has written the first checkpoint.
+    """
+
+    def __init__(self, path, sync_every=JOURNAL_SYNC_EVERY, started=False):
+        self.path = path
+        self.filename = os.path.basename(path)
+        self.sync_every = sync_every
+        self.started = started  # The file exists with a complete checkpoint
+        self.unsynced = 0
+
+    def start(self, save_data, game=None):
+        """Create the journal file with its first checkpoint.
+
+        The checkpoint is written to a temporary file and renamed into place,
+        so the journal never exists without a complete checkpoint.
+        """
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w') as f:
+            f.write(self._encode_checkpoint(save_data, game))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        self.started = True
+
+    def write_checkpoint(self, save_data, game=None):
+        """Append a snapshot of the whole game that replays can start from"""
+        self._append_line(self._encode_checkpoint(save_data, game))
+
+    def record_move(self, move, time_left):
+        """Append one played move and both clocks after it"""
+        self._append_line(json.dumps({
+            "move": encode_move(move),
+            "clock": [round(time_left["white"], 1), round(time_left["black"], 1)]
+        }, separators=(',', ':')) + "\n")
+
+    def sync(self):
+        """fsync the records written since the last sync to disk"""
+        if self.unsynced:
+            with open(self.path, 'a') as f:
+                os.fsync(f.fileno())
+            self.unsynced = 0
+
+    def close(self):
+        """Sync the journal file, called when the game stops writing to it"""
+        self.sync()
+
+    def _encode_checkpoint(self, save_data, game):
+        """Get the line of a checkpoint record, with the game record when there is one"""
+        record = {"checkpoint": save_data}
+        if game is not None:
+            record["game"] = game
+        return json.dumps(record, separators=(',', ':')) + "\n"
+
+    def _append_line(self, line):
+        """Append one record line, fsyncing once a batch of records has built up"""
+        if not self.started:
+            raise OSError(f"Journal {self.filename} has no checkpoint, not appending to it")
+        with open(self.path, 'a') as f:
+            f.write(line)
+            self.unsynced += 1
+            if self.unsynced >= self.sync_every:
+                f.flush()
+                os.fsync(f.fileno())
+                self.unsynced = 0
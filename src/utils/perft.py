@@ -0,0 +1,196 @@
+"""Perft benchmark for the move generator.
+
+Counts the leaf nodes of the legal move tree to a fixed depth from the
+starting position and from saved games, reports nodes per second and
+compares the results against a stored baseline.
+
+Usage:
+    python -m src.utils.perft --depth 4 --saved
+    python -m src.utils.perft --depth 3 --divide
+    python -m src.utils.perft --depth 4 --saved --update-baseline
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+from config.settings import SAVE_DIR
+from src.board.bitboard import PROMOTION_RANK, SQUARE_COORDS, iter_bits
+from src.game.move import Move
+from src.game.state import GameState, get_square_notation
+
+PROMOTION_PIECES = ["queen", "rook", "bishop", "knight"]
+DEFAULT_BASELINE = os.path.join("benchmarks", "perft_baseline.json")
+
+
+def _expand_moves(state):
+    """List legal (from_pos, to_pos, promotion) moves, one per promotion choice"""
+    board = state.board
+    promotion_rank = PROMOTION_RANK[state.current_turn]
+    moves = []
+    for from_square, targets in state.legal_move_masks(state.current_turn):
+        from_pos = SQUARE_COORDS[from_square]
+        promotes = targets & promotion_rank and board[from_pos[0]][from_pos[1]].position == "pawn"
+        for to_square in iter_bits(targets):
+            to_pos = SQUARE_COORDS[to_square]
+            if promotes and promotion_rank >> to_square & 1:
+                moves.extend((from_pos, to_pos, promotion) for promotion in PROMOTION_PIECES)
+            else:
+                moves.append((from_pos, to_pos, None))
+    return moves
+
+
+def count_moves(state):
+    """Count the legal moves of the side to move, one per promotion choice, straight from the bitmasks"""
+    board = state.board
+    promotion_rank = PROMOTION_RANK[state.current_turn]
+    count = 0
+    for from_square, targets in state.legal_move_masks(state.current_turn):
+        count += targets.bit_count()
+        promotions = targets & promotion_rank
+        if promotions and board[from_square >> 3][from_square & 7].position == "pawn":
+            count += (len(PROMOTION_PIECES) - 1) * promotions.bit_count()
+    return count
+
+
+def perft(state, depth):
+    """Count the leaf nodes of the legal move tree below the state"""
+    if depth <= 1:
+        return count_moves(state) if depth == 1 else 1
+
+    nodes = 0
+    for from_pos, to_pos, promotion in _expand_moves(state):
+        state.make_move(Move(from_pos, to_pos, promotion))
+        nodes += perft(state, depth - 1)
+        state.unmake_move()
+    return nodes
+
+
+def divide(state, depth):
+    """Get the perft node count below each root move, keyed by move text"""
+    results = {}
+    for from_pos, to_pos, promotion in _expand_moves(state):
+        move_text = get_square_notation(*from_pos) + get_square_notation(*to_pos)
+        if promotion:
+            move_text += promotion[0] if promotion != "knight" else "n"
+        state.make_move(Move(from_pos, to_pos, promotion))
+        results[move_text] = perft(state, depth - 1)
+        state.unmake_move()
+    return results
+
+
+def run_perft(state, max_depth):
+    """Run perft for every depth up to max_depth.
+
+    Returns a list of dicts with the depth, node count, elapsed seconds and
+    nodes per second of each run.
+    """
+    breakdown = []
+    for depth in range(1, max_depth + 1):
+        start = time.perf_counter()
+        nodes = perft(state, depth)
+        elapsed = time.perf_counter() - start
+        breakdown.append({
+            "depth": depth,
+            "nodes": nodes,
+            "seconds": elapsed,
+            "nps": nodes / elapsed if elapsed > 0 else 0.0
+        })
+    return breakdown
+
+
+def load_positions(include_saved=False, save_dir=SAVE_DIR):
+    """Get (name, GameState) pairs for the start position and optionally every saved game"""
+    positions = [("start", GameState())]
+    if include_saved:
+        for path in sorted(glob.glob(os.path.join(save_dir, "*.json"))):
+            with open(path, 'r') as f:
+                positions.append((os.path.basename(path), GameState.from_save_data(json.load(f))))
+    return positions
+
+
+def compare_to_baseline(name, breakdown, baseline):
+    """Compare a perft breakdown with the baseline entry for a position.
+
+    Returns (ok, lines) where ok is False if any node count differs.
+    """
+    entry = baseline.get(name)
+    if not entry:
+        return True, [f"  no baseline for {name}"]
+
+    ok = True
+    lines = []
+    for result in breakdown:
+        depth = result["depth"]
+        if depth > len(entry["nodes"]):
+            break
+        expected = entry["nodes"][depth - 1]
+        if result["nodes"] != expected:
+            ok = False
+            lines.append(f"  depth {depth}: MISMATCH {result['nodes']} nodes, baseline {expected}")
+
+    compared = min(len(breakdown), len(entry["nodes"]))
+    if compared and entry.get("nps"):
+        nps = breakdown[compared - 1]["nps"]
+        baseline_nps = entry["nps"][compared - 1]
+        lines.append(
+            f"  depth {compared}: {nps:,.0f} nps vs baseline {baseline_nps:,.0f} "
+            f"({(nps / baseline_nps - 1) * 100:+.1f}%)"
+        )
+    return ok, lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Perft move generation benchmark")
+    parser.add_argument("--depth", type=int, default=3, help="maximum search depth")
+    parser.add_argument("--saved", action="store_true", help="also run every saved game position")
+    parser.add_argument("--save-dir", default=SAVE_DIR, help="directory holding saved games")
+    parser.add_argument("--divide", action="store_true", help="print node counts per root move")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="overwrite the baseline")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+
+    all_ok = True
+    results = {}
+    for name, state in load_positions(args.saved, args.save_dir):
+        print(f"{name} ({state.current_turn} to move)")
+        breakdown = run_perft(state, args.depth)
+        for result in breakdown:
+            print(
+                f"  depth {result['depth']}: {result['nodes']:>10} nodes "
+                f"{result['seconds']:8.3f}s {result['nps']:>12,.0f} nps"
+            )
+
+        if args.divide:
+            for move_text, nodes in sorted(divide(state, args.depth).items()):
+                print(f"    {move_text}: {nodes}")
+
+        ok, lines = compare_to_baseline(name, breakdown, baseline)
+        all_ok = all_ok and ok
+        for line in lines:
+            print(line)
+
+        results[name] = {
+            "nodes": [result["nodes"] for result in breakdown],
+            "nps": [round(result["nps"]) for result in breakdown]
+        }
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        baseline.update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=4)
+        print(f"Baseline written to {args.baseline}")
+
+    return 0 if all_ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+import queue
+import threading
+
+from src.utils.logger import logger
+
+
+class SaveWorker:
+    """Runs save and load jobs one at a time on a background thread.
+
+    Jobs run in the order they were submitted, so journal writes queued after
+    a save land in the file after it. Each job's on_complete callback is
+    handed back through poll() and so runs on the game thread, between frames.
+    """
+
+    def __init__(self):
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self.pending = 0  # Jobs submitted whose results have not been polled yet
+        self.thread = threading.Thread(target=self._run, name="save-worker", daemon=True)
+        self.thread.start()
+
+    def submit(self, function, *args, on_complete=None):
+        """Queue function(*args) to run on the worker, then on_complete(result) on poll"""
+        self.pending += 1
+        self.jobs.put((function, args, on_complete))
+
+    def busy(self):
+        """Check if any submitted job has not been polled yet"""
+        return self.pending > 0
+
+    def wait(self):
+        """Block until every job submitted so far has run"""
+        self.jobs.join()
+
+    def poll(self):
+        """Run the callbacks of every finished job, call once per frame"""
+        while True:
+            try:
+                on_complete, result = self.results.get_nowait()
+            except queue.Empty:
+                return
+            self.pending -= 1
+            if on_complete is not None:
+                on_complete(result)
+
+    def shutdown(self):
+        """Finish every queued job and stop the thread"""
+        if self.thread.is_alive():
+            self.jobs.put(None)
+            self.thread.join()
+
+    def _run(self):
+        """Worker thread: run jobs until shutdown"""
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                self.jobs.task_done()
+                return
+            function, args, on_complete = job
+            try:
+                result = function(*args)
+            except Exception as e:
+                logger.error(f"Error in background save job: {str(e)}")
+                result = None
+            self.results.put((on_complete, result))
+            self.jobs.task_done()
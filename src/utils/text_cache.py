@@ -0,0 +1,35 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """Least recently used cache of rendered text surfaces.
+
+    Font.render is one of the most expensive calls in a frame, while almost
+    every label on screen stays the same from one frame to the next.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        """Get the surface for text drawn with font and color, rendering it on a miss"""
+        key = (font, text, color, antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)  # Evict the least recently used text
+        return surface
+
+    def clear(self):
+        """Drop every cached surface, e.g. after a font or theme change"""
+        self.surfaces.clear()